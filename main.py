@@ -1,35 +1,21 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import logging
 import os
+import selectors
 import signal
+import socket
 import sys
+import threading
 import time
+from typing import List, Optional
 
-from src.scheduler import TaskScheduler
 from src.logger import Logger, setup_bot_library_logging
 from src.cli_output import CliOutput
 from src.config import Config
 from src.constants import Bot, Defaults, Messages, Paths
-from src.instance_controller import InstanceController
 from src.formatters import format_task_list, parse_interval
-from src.commands import (
-    handle_list,
-    handle_history,
-    handle_delete,
-    handle_set_start_time,
-    handle_set_interval,
-    handle_set_arguments,
-    handle_rename,
-    handle_copy_task,
-    handle_edit,
-    handle_add,
-    handle_script,
-    handle_run_id,
-    handle_ftp_sync,
-    handle_uv_command,
-    handle_shutdown,
-)
 
 
 def _interval_arg(value: str) -> int:
@@ -40,8 +26,13 @@ def _interval_arg(value: str) -> int:
         raise argparse.ArgumentTypeError(str(exc)) from exc
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments."""
+def _abs_path(value: str) -> str:
+    """Argparse adapter that resolves a path to an absolute path."""
+    return os.path.abspath(value)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description="Task Scheduler for Python Scripts and Batch Files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -98,7 +89,7 @@ Note:
 
     group.add_argument(
         "--script",
-        type=str,
+        type=_abs_path,
         help="Path to the Python script or batch file to schedule"
     )
 
@@ -230,14 +221,82 @@ Note:
         help="Manually trigger FTP sync of the status page"
     )
 
-    # Collect remaining arguments after --
-    parser.add_argument(
-        'script_args',
-        nargs=argparse.REMAINDER,
-        help="Arguments to pass to the script (everything after --)"
-    )
+    # Arguments after -- are split off by parse_arguments before parsing
+    parser.set_defaults(script_args=[])
+
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the parser on first use and reuse it afterwards."""
+    return _build_parser()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Everything from the first -- on is passed to the script untouched.
+    # Splitting it off here keeps argparse out of its slow REMAINDER path.
+    try:
+        split = argv.index("--")
+    except ValueError:
+        split = len(argv)
+    scheduler_argv, script_args = argv[:split], argv[split:]
+
+    args = _get_parser().parse_args(scheduler_argv)
+    args.script_args = script_args
+    return args
+
+
+def _create_scheduler():
+    """Import and create the scheduler only for commands that need it."""
+    from src.scheduler import TaskScheduler
+
+    return TaskScheduler()
+
+
+# One-shot commands in priority order:
+# attribute -> (handler name in src.commands, needs scheduler, extra handler args)
+_COMMANDS = {
+    "list": ("handle_list", True, lambda a: (a.list,)),
+    "history": ("handle_history", True, lambda a: (a.history,)),
+    "delete": ("handle_delete", True, lambda a: (a.delete,)),
+    "set_start_time": ("handle_set_start_time", True, lambda a: tuple(a.set_start_time)),
+    "set_interval": ("handle_set_interval", True, lambda a: tuple(a.set_interval)),
+    "set_arguments": ("handle_set_arguments", True, lambda a: (a.set_arguments,)),
+    "rename": ("handle_rename", True, lambda a: (a.rename,)),
+    "copy_task": ("handle_copy_task", True, lambda a: (a.copy_task,)),
+    "edit": ("handle_edit", True, lambda a: (a.edit,)),
+    "add": ("handle_add", True, lambda a: ()),
+    "script": ("handle_script", True, lambda a: (a,)),
+    "uv_command": ("handle_uv_command", True, lambda a: (a,)),
+    "run_id": ("handle_run_id", True, lambda a: (a.run_id,)),
+    "ftp_sync": ("handle_ftp_sync", False, lambda a: (Config(),)),
+    "shutdown": ("handle_shutdown", False, lambda a: ()),
+}
+
+
+def _run_command(args: argparse.Namespace, cli: CliOutput) -> bool:
+    """Run the first one-shot command requested in args.
+
+    Returns:
+        True if a command ran, False if the scheduler should be started
+    """
+    for attr, (handler_name, needs_scheduler, extra_args) in _COMMANDS.items():
+        value = getattr(args, attr)
+        if value is None or value is False:
+            continue
 
-    return parser.parse_args()
+        import src.commands
+
+        handler = getattr(src.commands, handler_name)
+        leading = (_create_scheduler(), cli) if needs_scheduler else (cli,)
+        handler(*leading, *extra_args(args))
+        return True
+    return False
 
 
 def perform_shutdown():
@@ -259,11 +318,31 @@ def perform_shutdown():
     os._exit(0)
 
 
+# Set by signal_handler to wake the main loop for shutdown
+stop_event = threading.Event()
+
+
+def _create_signal_wakeup() -> selectors.BaseSelector:
+    """Return a selector that becomes readable as soon as a signal arrives.
+
+    The interpreter writes a byte to the wakeup socket from its C-level signal
+    handler, so select() returns immediately on every platform, including
+    Windows where a blocked wait is not interrupted by Ctrl+C.
+    """
+    reader, writer = socket.socketpair()
+    reader.setblocking(False)
+    writer.setblocking(False)
+    signal.set_wakeup_fd(writer.fileno())
+    selector = selectors.DefaultSelector()
+    # Keep the writer referenced through the selector so its fd stays open
+    selector.register(reader, selectors.EVENT_READ, data=writer)
+    return selector
+
+
 def signal_handler(signum, frame):
-    """Handle shutdown signals."""
+    """Handle shutdown signals by waking the main loop."""
     logger.info("Shutdown signal received")
-    perform_shutdown()
-    sys.exit(0)
+    stop_event.set()
 
 
 if __name__ == "__main__":
@@ -271,83 +350,29 @@ if __name__ == "__main__":
         # Parse arguments
         args = parse_arguments()
 
-        # Update logging configuration if specified
-        config = Config()
-        if args.log_level:
-            config.set_logging_level(args.log_level)
-        if args.detailed_logs:
-            config.set_detailed_logging(args.detailed_logs.lower() == 'true')
+        # Update logging configuration if specified; this must happen before
+        # any Logger reads the settings
+        if args.log_level or args.detailed_logs:
+            config = Config()
+            if args.log_level:
+                config.set_logging_level(args.log_level)
+            if args.detailed_logs:
+                config.set_detailed_logging(args.detailed_logs.lower() == 'true')
 
-        # Initialize logger and scheduler
-        logger = Logger("Main")
+        # One-shot commands load config and scheduler only if they need them
         cli = CliOutput()
-        scheduler = TaskScheduler()
-
-        if args.list is not None:
-            handle_list(scheduler, cli, args.list)
-            sys.exit(0)
-
-        elif args.history is not None:
-            handle_history(scheduler, cli, args.history)
-            sys.exit(0)
-
-        elif args.delete is not None:
-            handle_delete(scheduler, cli, args.delete)
+        if _run_command(args, cli):
             sys.exit(0)
 
-        elif args.set_start_time:
-            task_id_str, time_value = args.set_start_time
-            handle_set_start_time(scheduler, cli, task_id_str, time_value)
-            sys.exit(0)
-
-        elif args.set_interval:
-            task_id_str, interval_str = args.set_interval
-            handle_set_interval(scheduler, cli, task_id_str, interval_str)
-            sys.exit(0)
-
-        elif args.set_arguments is not None:
-            handle_set_arguments(scheduler, cli, args.set_arguments)
-            sys.exit(0)
-
-        elif args.rename is not None:
-            handle_rename(scheduler, cli, args.rename)
-            sys.exit(0)
-
-        elif args.copy_task is not None:
-            handle_copy_task(scheduler, cli, args.copy_task)
-            sys.exit(0)
-
-        elif args.edit is not None:
-            handle_edit(scheduler, cli, args.edit)
-            sys.exit(0)
-
-        elif args.add:
-            handle_add(scheduler, cli)
-            sys.exit(0)
-
-        elif args.script:
-            handle_script(scheduler, cli, args)
-            sys.exit(0)
-
-        elif args.uv_command:
-            handle_uv_command(scheduler, cli, args)
-            sys.exit(0)
-
-        elif args.run_id:
-            handle_run_id(scheduler, cli, args.run_id)
-            sys.exit(0)
-
-        elif args.ftp_sync:
-            handle_ftp_sync(cli, config)
-            sys.exit(0)
-
-        elif args.shutdown:
-            handle_shutdown(cli)
-            sys.exit(0)
+        config = Config()
+        logger = Logger("Main")
 
         # If no specific action was requested, run the scheduler.
         # Guard against a second continuous instance firing every task twice;
         # offer to shut down an already-running instance and take over.
+        from src.instance_controller import InstanceController
+
+        scheduler = _create_scheduler()
         instance = InstanceController()
         if not instance.try_acquire():
             answer = input(Messages.RESTART_PROMPT).strip().lower()
@@ -369,15 +394,15 @@ if __name__ == "__main__":
         instance.clear_request()
         cli.info(Messages.STARTING_INSTANCE)
 
-        bot_logger = Logger("Bot", log_file_prefix=Paths.LOG_FILE_PREFIX_BOT)
-        setup_bot_library_logging()
-
         bot_manager = None
         processor = None
         health_monitor = None
         bot_type = config.get_bot_type()
 
-        if bot_type and bot_type.lower() != "none":
+        # Without a bot, skip the bot logger and every bot import entirely
+        if bot_type and bot_type.lower() != Bot.TYPE_NONE:
+            bot_logger = Logger("Bot", log_file_prefix=Paths.LOG_FILE_PREFIX_BOT)
+            setup_bot_library_logging()
             try:
                 from bot_commander import BotManager
                 from src.bot.command_processor import TaskCommandProcessor
@@ -401,7 +426,7 @@ if __name__ == "__main__":
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-        scheduler.start()
+        tasks = scheduler.start()
 
         # Initialize bot if configured
         if bot_manager is not None:
@@ -414,14 +439,22 @@ if __name__ == "__main__":
             except Exception as e:
                 bot_logger.error(f"Bot failed to start: {e}", exc_info=True)
 
-        tasks = scheduler.list_tasks()
-        logger.info("Current tasks:" + format_task_list(tasks, show_next_run=True))
-        logger.info("\nPress Ctrl+C to exit")
+        logger.info(
+            "Current tasks:"
+            + format_task_list(tasks, show_next_run=True)
+            + "\n\nPress Ctrl+C to exit"
+        )
 
         try:
+            wakeup = _create_signal_wakeup()
             last_health_check = time.time()
-            while True:
-                time.sleep(1)
+            while not stop_event.is_set():
+                # Returns early when a signal arrives; signal_handler then
+                # sets stop_event
+                for key, _ in wakeup.select(Defaults.IDLE_POLL_SECONDS):
+                    key.fileobj.recv(64)
+                if stop_event.is_set():
+                    break
                 if instance.shutdown_requested():
                     logger.info("Shutdown request received")
                     break
@@ -2,7 +2,7 @@
 
 import threading
 from collections.abc import Callable
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from bot_commander import BotMessage, BotResponse, BufferedNotifier, Commander
 
@@ -11,12 +11,41 @@ from .conversation import AddWizard, DeleteConfirmation, EditWizard
 from .formatters import format_execution_history_compact, format_task_list_compact
 from .interaction_handler import BotInteractionHandler, BotScriptOutput
 from src.config import Config
-from src.logger import Logger
 from src.scheduler import TaskScheduler
 
 
-@dataclass(frozen=True)
-class BotConfig:
+# Message templates used by the per-request handlers, bound at module level
+_MSG_TASK_RUNNING = Messages.TASK_RUNNING
+_MSG_TASK_NOT_FOUND = Messages.TASK_NOT_FOUND
+_MSG_EXEC_SUCCESS = Messages.TASK_EXECUTED_SUCCESS
+_MSG_EXEC_FAILURE = Messages.TASK_EXECUTED_FAILURE
+_MSG_EXEC_ERROR = Messages.TASK_EXECUTION_ERROR
+
+# Constant replies, shared instead of rebuilt per message
+_HELP_RESPONSE = BotResponse(text=Messages.HELP)
+_INTERACTION_CANCELLED_RESPONSE = BotResponse(text=Messages.INTERACTION_CANCELLED)
+_EMPTY_RESPONSE = BotResponse(text="")
+
+# Fixed error replies, built once instead of formatted per request
+_INVALID_TASK_ID_RESPONSES = {
+    command: BotResponse(text=Messages.INVALID_TASK_ID.format(command))
+    for command in (Commands.RUN, Commands.EDIT, Commands.DELETE)
+}
+
+
+def _split_command(text: str) -> tuple[str, str]:
+    """Split message text into its alias-resolved command name and arguments."""
+    parts = text.split(None, 1)
+    cmd = parts[0].lower() if parts else ""
+    args = parts[1] if len(parts) > 1 else ""
+    name = Commands.NAMES.get(cmd)
+    if name is None:
+        cmd = cmd.lstrip("/")
+        name = Commands.NAMES.get(cmd, cmd)
+    return name, args
+
+
+class BotConfig(NamedTuple):
     """Bot permission configuration."""
 
     allow_add: bool
@@ -36,7 +65,11 @@ class TaskCommandProcessor(Commander):
         )
         self._scheduler = scheduler
         self._bot_config = bot_config
-        self._logger = Logger("TaskCommandProcessor")
+        self._permissions = {
+            "allow_add": bot_config.allow_add,
+            "allow_edit": bot_config.allow_edit,
+            "allow_delete": bot_config.allow_delete,
+        }
         self._notifier: Callable[[str, str], None] | None = None
         self._active_handlers: dict[str, BotInteractionHandler] = {}
 
@@ -81,67 +114,58 @@ class TaskCommandProcessor(Commander):
         text = message.text.strip()
 
         # Intercept messages for users with active interactive handlers
-        if user_id in self._active_handlers:
-            cmd = text.split(maxsplit=1)[0].lower().lstrip("/")
-            resolved = Commands.ALIASES.get(cmd, cmd)
+        handler = self._active_handlers.get(user_id)
+        if handler is not None:
+            resolved, _ = _split_command(text)
             if resolved == "cancel":
-                self._active_handlers[user_id].cancel()
+                handler.cancel()
                 self._active_handlers.pop(user_id, None)
-                return BotResponse(text=Messages.INTERACTION_CANCELLED)
-            self._active_handlers[user_id].resolve(text)
-            return BotResponse(text="")
+                return _INTERACTION_CANCELLED_RESPONSE
+            handler.resolve(text)
+            return _EMPTY_RESPONSE
+
+        if not text:
+            return super().handle(message)
 
         # Only normalize when no active conversation (conversation input is free-form)
-        if text and user_id not in self._conversations:
-            parts = text.split(maxsplit=1)
-            cmd = parts[0].lower().lstrip("/")
-            cmd = Commands.ALIASES.get(cmd, cmd)
+        if user_id not in self._conversations:
+            cmd, args = _split_command(text)
             normalized = "/" + cmd
-            if len(parts) > 1:
-                normalized += " " + parts[1]
+            if args:
+                normalized += " " + args
             message = BotMessage(user_id=user_id, text=normalized)
-        elif text and user_id in self._conversations:
+        else:
             # Still resolve cancel alias within conversations
-            cmd = text.split(maxsplit=1)[0].lower().lstrip("/")
-            resolved = Commands.ALIASES.get(cmd, cmd)
+            resolved, _ = _split_command(text)
             if resolved == "cancel":
                 message = BotMessage(user_id=user_id, text="/cancel")
         return super().handle(message)
 
     def _check_permission(self, permission: str, user_id: str) -> bool:
         """Check if a permission is allowed."""
-        if permission == "allow_add":
-            return self._bot_config.allow_add
-        if permission == "allow_edit":
-            return self._bot_config.allow_edit
-        if permission == "allow_delete":
-            return self._bot_config.allow_delete
-        return True
+        return self._permissions.get(permission, True)
 
     # -- Command handlers --
 
     def _cmd_help(self, user_id: str, args: str) -> BotResponse:
         """Handle the /help command."""
-        return BotResponse(text=Messages.HELP)
+        return _HELP_RESPONSE
 
     def _cmd_list(self, user_id: str, args: str) -> BotResponse:
         """Handle the /list command with optional filter."""
-        tasks = self._scheduler.list_tasks()
-        if args:
-            filter_lower = args.lower()
-            tasks = [t for t in tasks if filter_lower in t["name"].lower()]
+        filter_lower = args.lower()
+        tasks = self._scheduler.list_tasks(name_filter=filter_lower or None)
         return BotResponse(text=format_task_list_compact(tasks))
 
     def _cmd_run(self, user_id: str, args: str) -> BotResponse:
         """Handle the /run command — returns immediately, runs task in background."""
         try:
-            task_id = int(args.strip())
-        except (ValueError, AttributeError):
-            return BotResponse(text=Messages.INVALID_TASK_ID.format(Commands.RUN))
+            task_id = int(args)
+        except ValueError:
+            return _INVALID_TASK_ID_RESPONSES[Commands.RUN]
 
         # Get task name for response message
-        tasks = self._scheduler.list_tasks()
-        task = next((t for t in tasks if t["id"] == task_id), None)
+        task = self._scheduler.get_task(task_id)
         task_name = task["name"] if task else f"Task {task_id}"
 
         threading.Thread(
@@ -149,7 +173,7 @@ class TaskCommandProcessor(Commander):
             args=(user_id, task_id, task_name),
             daemon=True,
         ).start()
-        return BotResponse(text=Messages.TASK_RUNNING.format(task_name, task_id))
+        return BotResponse(text=_MSG_TASK_RUNNING.format(task_name, task_id))
 
     def _run_task_async(self, user_id: str, task_id: int, task_name: str) -> None:
         """Execute a task in a background thread and notify the user."""
@@ -173,11 +197,11 @@ class TaskCommandProcessor(Commander):
             if script_output:
                 script_output.close()
             if success:
-                text = Messages.TASK_EXECUTED_SUCCESS.format(task_name, task_id)
+                text = _MSG_EXEC_SUCCESS.format(task_name, task_id)
             else:
-                text = Messages.TASK_EXECUTED_FAILURE.format(task_name, task_id)
+                text = _MSG_EXEC_FAILURE.format(task_name, task_id)
         except Exception as e:
-            text = Messages.TASK_EXECUTION_ERROR.format(task_id, str(e))
+            text = _MSG_EXEC_ERROR.format(task_id, str(e))
         finally:
             self._active_handlers.pop(user_id, None)
             if script_output:
@@ -188,7 +212,7 @@ class TaskCommandProcessor(Commander):
     def _cmd_history(self, user_id: str, args: str) -> BotResponse:
         """Handle the /history command."""
         try:
-            limit = int(args.strip()) if args.strip() else 10
+            limit = int(args) if args else 10
         except ValueError:
             limit = 10
         executions = self._scheduler.db.get_recent_executions(limit)
@@ -203,14 +227,13 @@ class TaskCommandProcessor(Commander):
     def _cmd_edit(self, user_id: str, args: str) -> BotResponse:
         """Handle the /edit command - starts the edit wizard."""
         try:
-            task_id = int(args.strip())
-        except (ValueError, AttributeError):
-            return BotResponse(text=Messages.INVALID_TASK_ID.format(Commands.EDIT))
+            task_id = int(args)
+        except ValueError:
+            return _INVALID_TASK_ID_RESPONSES[Commands.EDIT]
 
-        tasks = self._scheduler.list_tasks()
-        task = next((t for t in tasks if t["id"] == task_id), None)
+        task = self._scheduler.get_task(task_id)
         if not task:
-            return BotResponse(text=Messages.TASK_NOT_FOUND.format(task_id))
+            return BotResponse(text=_MSG_TASK_NOT_FOUND.format(task_id))
 
         state, response = EditWizard.start(task)
         self.start_conversation(user_id, state)
@@ -219,14 +242,13 @@ class TaskCommandProcessor(Commander):
     def _cmd_delete(self, user_id: str, args: str) -> BotResponse:
         """Handle the /delete command - starts delete confirmation."""
         try:
-            task_id = int(args.strip())
-        except (ValueError, AttributeError):
-            return BotResponse(text=Messages.INVALID_TASK_ID.format(Commands.DELETE))
+            task_id = int(args)
+        except ValueError:
+            return _INVALID_TASK_ID_RESPONSES[Commands.DELETE]
 
-        tasks = self._scheduler.list_tasks()
-        task = next((t for t in tasks if t["id"] == task_id), None)
+        task = self._scheduler.get_task(task_id)
         if not task:
-            return BotResponse(text=Messages.TASK_NOT_FOUND.format(task_id))
+            return BotResponse(text=_MSG_TASK_NOT_FOUND.format(task_id))
 
         state, response = DeleteConfirmation.start(task_id, task["name"])
         self.start_conversation(user_id, state)
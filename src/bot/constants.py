@@ -26,6 +26,20 @@ class Commands:
         "exit": "cancel",
     }
 
+    # Every accepted command word (lowercase, with or without slash) -> canonical
+    # name, so resolving a word is a single lookup whether it is an alias or not
+    NAMES: dict[str, str] = {
+        prefix + word: name
+        for word, name in {
+            **{
+                c[1:]: c[1:]
+                for c in (LIST, RUN, HISTORY, ADD, EDIT, DELETE, HELP, CANCEL)
+            },
+            **ALIASES,
+        }.items()
+        for prefix in ("", "/")
+    }
+
 
 class Messages:
     """Bot response message templates."""
@@ -1,6 +1,5 @@
 """Conversation state machines for bot wizards and confirmations."""
 
-import shlex
 from typing import Optional
 
 from bot_commander import (
@@ -11,9 +10,41 @@ from bot_commander import (
     is_valid_time,
 )
 
+from ..formatters import split_arguments
 from .constants import Messages
 from .formatters import format_add_summary, format_edit_changes
 
+# Replies whose text never changes are built once and shared.
+_CONFIRMED_RESPONSE = BotResponse(text=CONFIRMED_SENTINEL)
+_DELETE_CANCELLED_RESPONSE = BotResponse(text=Messages.DELETE_CANCELLED)
+_OPERATION_CANCELLED_RESPONSE = BotResponse(text=Messages.OPERATION_CANCELLED)
+_WIZARD_ADD_ARGUMENTS_RESPONSE = BotResponse(text=Messages.WIZARD_ADD_ARGUMENTS)
+_WIZARD_ADD_COMMAND_RESPONSE = BotResponse(text=Messages.WIZARD_ADD_COMMAND)
+_WIZARD_ADD_INTERVAL_RESPONSE = BotResponse(text=Messages.WIZARD_ADD_INTERVAL)
+_WIZARD_ADD_LAUNCH_NEW_PROCESS_RESPONSE = BotResponse(
+    text=Messages.WIZARD_ADD_LAUNCH_NEW_PROCESS
+)
+_WIZARD_ADD_NAME_RESPONSE = BotResponse(text=Messages.WIZARD_ADD_NAME)
+_WIZARD_ADD_START_RESPONSE = BotResponse(text=Messages.WIZARD_ADD_START)
+_WIZARD_ADD_START_TIME_RESPONSE = BotResponse(text=Messages.WIZARD_ADD_START_TIME)
+_WIZARD_EDIT_NO_CHANGES_RESPONSE = BotResponse(text=Messages.WIZARD_EDIT_NO_CHANGES)
+_WIZARD_INVALID_INTERVAL_RESPONSE = BotResponse(text=Messages.WIZARD_INVALID_INTERVAL)
+_WIZARD_INVALID_TIME_RESPONSE = BotResponse(text=Messages.WIZARD_INVALID_TIME)
+
+# The edit launch-mode prompt only ever shows "yes" or "no" as the current value
+_WIZARD_EDIT_LAUNCH_NEW_PROCESS_RESPONSES = {
+    current: BotResponse(
+        text=Messages.WIZARD_EDIT_LAUNCH_NEW_PROCESS.format("yes" if current else "no")
+    )
+    for current in (False, True)
+}
+
+# Lowercased replies recognised by the yes/no and edit keep/clear prompts.
+_YES_WORDS = frozenset(("yes", "y"))
+_NO_WORDS = frozenset(("no", "n"))
+_KEEP_WORDS = frozenset(("skip", "s"))
+_CLEAR_WORDS = frozenset(("none", ""))
+
 
 class AddWizard:
     """Stateless wizard for adding a task step-by-step.
@@ -33,7 +64,7 @@ class AddWizard:
     def start() -> tuple[ConversationState, BotResponse]:
         """Start the add wizard. Returns initial state and first prompt."""
         state = ConversationState(kind="add_wizard", step=0)
-        return state, BotResponse(text=Messages.WIZARD_ADD_START)
+        return state, _WIZARD_ADD_START_RESPONSE
 
     @staticmethod
     def advance(
@@ -44,26 +75,10 @@ class AddWizard:
         new_state is None when the wizard completes or is cancelled.
         """
         step = state.step
-        text = user_input.strip()
-
-        if step == 0:
-            return _add_step_script_path(state, text)
-        if step == 1:
-            return _add_step_command(state, text)
-        if step == 2:
-            return _add_step_name(state, text)
-        if step == 3:
-            return _add_step_interval(state, text)
-        if step == 4:
-            return _add_step_start_time(state, text)
-        if step == 5:
-            return _add_step_launch_new_process(state, text)
-        if step == 6:
-            return _add_step_arguments(state, text)
-        if step == 7:
-            return _add_step_confirm(state, text)
-
-        return None, BotResponse(text=Messages.OPERATION_CANCELLED)
+        if 0 <= step < len(_ADD_STEPS):
+            return _ADD_STEPS[step](state, user_input.strip())
+
+        return None, _OPERATION_CANCELLED_RESPONSE
 
 
 class EditWizard:
@@ -88,7 +103,11 @@ class EditWizard:
         state = ConversationState(
             kind="edit_wizard",
             step=0,
-            data={"original": task, "changes": {}},
+            data={
+                "original": task,
+                "changes": {},
+                "args_display": " ".join(task.get("arguments") or ()),
+            },
         )
         detail = format_task_detail(task)
         intro = Messages.WIZARD_EDIT_START.format(task["name"], task["id"], detail)
@@ -106,26 +125,10 @@ class EditWizard:
         new_state is None when the wizard completes or is cancelled.
         """
         step = state.step
-        text = user_input.strip()
-
-        if step == 0:
-            return _edit_step_script_path(state, text)
-        if step == 1:
-            return _edit_step_command(state, text)
-        if step == 2:
-            return _edit_step_name(state, text)
-        if step == 3:
-            return _edit_step_interval(state, text)
-        if step == 4:
-            return _edit_step_start_time(state, text)
-        if step == 5:
-            return _edit_step_launch_new_process(state, text)
-        if step == 6:
-            return _edit_step_arguments(state, text)
-        if step == 7:
-            return _edit_step_confirm(state, text)
-
-        return None, BotResponse(text=Messages.OPERATION_CANCELLED)
+        if 0 <= step < len(_EDIT_STEPS):
+            return _EDIT_STEPS[step](state, user_input.strip())
+
+        return None, _OPERATION_CANCELLED_RESPONSE
 
 
 class DeleteConfirmation:
@@ -150,9 +153,9 @@ class DeleteConfirmation:
         Returns (None, empty BotResponse) on 'yes' so the caller can perform
         the actual deletion. Returns cancel message otherwise.
         """
-        if user_input.strip().lower() in ("yes", "y"):
-            return None, BotResponse(text=CONFIRMED_SENTINEL)
-        return None, BotResponse(text=Messages.DELETE_CANCELLED)
+        if user_input.strip().lower() in _YES_WORDS:
+            return None, _CONFIRMED_RESPONSE
+        return None, _DELETE_CANCELLED_RESPONSE
 
 
 # ---------------------------------------------------------------------------
@@ -169,12 +172,12 @@ def _add_step_script_path(
         state.data["task_type"] = "uv_command"
         state.data["script_path"] = text[len(_UV_PREFIX) :].strip()
         state.step = 1
-        return state, BotResponse(text=Messages.WIZARD_ADD_COMMAND)
+        return state, _WIZARD_ADD_COMMAND_RESPONSE
 
     state.data["task_type"] = "script"
     state.data["script_path"] = text
     state.step = 2
-    return state, BotResponse(text=Messages.WIZARD_ADD_NAME)
+    return state, _WIZARD_ADD_NAME_RESPONSE
 
 
 def _add_step_command(
@@ -182,7 +185,7 @@ def _add_step_command(
 ) -> tuple[ConversationState, BotResponse]:
     state.data["command"] = text
     state.step = 2
-    return state, BotResponse(text=Messages.WIZARD_ADD_NAME)
+    return state, _WIZARD_ADD_NAME_RESPONSE
 
 
 def _add_step_name(
@@ -190,7 +193,7 @@ def _add_step_name(
 ) -> tuple[ConversationState, BotResponse]:
     state.data["name"] = text
     state.step = 3
-    return state, BotResponse(text=Messages.WIZARD_ADD_INTERVAL)
+    return state, _WIZARD_ADD_INTERVAL_RESPONSE
 
 
 def _add_step_interval(
@@ -199,18 +202,18 @@ def _add_step_interval(
     try:
         interval = int(text)
         if interval < 0:
-            return state, BotResponse(text=Messages.WIZARD_INVALID_INTERVAL)
+            return state, _WIZARD_INVALID_INTERVAL_RESPONSE
         state.data["interval"] = interval
         if interval == 0:
             # Manual-only: skip start_time, go to launch_new_process
             state.data["start_time"] = None
             state.step = 5
-            return state, BotResponse(text=Messages.WIZARD_ADD_LAUNCH_NEW_PROCESS)
+            return state, _WIZARD_ADD_LAUNCH_NEW_PROCESS_RESPONSE
         state.data["launch_new_process"] = False
         state.step = 4
-        return state, BotResponse(text=Messages.WIZARD_ADD_START_TIME)
+        return state, _WIZARD_ADD_START_TIME_RESPONSE
     except ValueError:
-        return state, BotResponse(text=Messages.WIZARD_INVALID_INTERVAL)
+        return state, _WIZARD_INVALID_INTERVAL_RESPONSE
 
 
 def _add_step_start_time(
@@ -220,21 +223,21 @@ def _add_step_start_time(
         state.data["start_time"] = None
     else:
         if not is_valid_time(text):
-            return state, BotResponse(text=Messages.WIZARD_INVALID_TIME)
+            return state, _WIZARD_INVALID_TIME_RESPONSE
         state.data["start_time"] = text
     state.step = 6
-    return state, BotResponse(text=Messages.WIZARD_ADD_ARGUMENTS)
+    return state, _WIZARD_ADD_ARGUMENTS_RESPONSE
 
 
 def _add_step_launch_new_process(
     state: ConversationState, text: str
 ) -> tuple[ConversationState, BotResponse]:
-    if text.lower() in ("yes", "y"):
+    if text.lower() in _YES_WORDS:
         state.data["launch_new_process"] = True
     else:
         state.data["launch_new_process"] = False
     state.step = 6
-    return state, BotResponse(text=Messages.WIZARD_ADD_ARGUMENTS)
+    return state, _WIZARD_ADD_ARGUMENTS_RESPONSE
 
 
 def _add_step_arguments(
@@ -243,7 +246,7 @@ def _add_step_arguments(
     if is_skip(text):
         state.data["arguments"] = None
     else:
-        state.data["arguments"] = shlex.split(text)
+        state.data["arguments"] = split_arguments(text)
     state.step = 7
     summary = format_add_summary(state.data)
     return state, BotResponse(text=Messages.WIZARD_ADD_CONFIRM.format(summary))
@@ -252,9 +255,9 @@ def _add_step_arguments(
 def _add_step_confirm(
     state: ConversationState, text: str
 ) -> tuple[Optional[ConversationState], BotResponse]:
-    if text.lower() in ("yes", "y"):
-        return None, BotResponse(text=CONFIRMED_SENTINEL)
-    return None, BotResponse(text=Messages.OPERATION_CANCELLED)
+    if text.lower() in _YES_WORDS:
+        return None, _CONFIRMED_RESPONSE
+    return None, _OPERATION_CANCELLED_RESPONSE
 
 
 # ---------------------------------------------------------------------------
@@ -311,12 +314,8 @@ def _edit_step_interval(
         effective_interval = state.data["changes"].get("interval", original["interval"])
         if effective_interval == 0:
             state.step = 5
-            current_launch = original.get("launch_new_process", False)
-            return state, BotResponse(
-                text=Messages.WIZARD_EDIT_LAUNCH_NEW_PROCESS.format(
-                    "yes" if current_launch else "no"
-                )
-            )
+            current_launch = bool(original.get("launch_new_process", False))
+            return state, _WIZARD_EDIT_LAUNCH_NEW_PROCESS_RESPONSES[current_launch]
         state.step = 4
         return state, BotResponse(
             text=Messages.WIZARD_EDIT_START_TIME.format(original.get("start_time", ""))
@@ -325,18 +324,14 @@ def _edit_step_interval(
     try:
         interval = int(text)
         if interval < 0:
-            return state, BotResponse(text=Messages.WIZARD_INVALID_INTERVAL)
+            return state, _WIZARD_INVALID_INTERVAL_RESPONSE
         state.data["changes"]["interval"] = interval
         if interval == 0:
             # Manual-only: clear start_time and go to launch_new_process
             state.data["changes"]["start_time"] = None
             state.step = 5
-            current_launch = original.get("launch_new_process", False)
-            return state, BotResponse(
-                text=Messages.WIZARD_EDIT_LAUNCH_NEW_PROCESS.format(
-                    "yes" if current_launch else "no"
-                )
-            )
+            current_launch = bool(original.get("launch_new_process", False))
+            return state, _WIZARD_EDIT_LAUNCH_NEW_PROCESS_RESPONSES[current_launch]
         # Non-zero interval: clear launch_new_process
         state.data["changes"]["launch_new_process"] = False
         state.step = 4
@@ -344,41 +339,39 @@ def _edit_step_interval(
             text=Messages.WIZARD_EDIT_START_TIME.format(original.get("start_time", ""))
         )
     except ValueError:
-        return state, BotResponse(text=Messages.WIZARD_INVALID_INTERVAL)
+        return state, _WIZARD_INVALID_INTERVAL_RESPONSE
 
 
 def _edit_step_start_time(
     state: ConversationState, text: str
 ) -> tuple[ConversationState, BotResponse]:
-    original = state.data["original"]
-    if text.lower() in ("skip", "s"):
+    answer = text.lower()
+    if answer in _KEEP_WORDS:
         pass  # no change
-    elif text.lower() in ("none", ""):
+    elif answer in _CLEAR_WORDS:
         state.data["changes"]["start_time"] = None
     else:
         if not is_valid_time(text):
-            return state, BotResponse(text=Messages.WIZARD_INVALID_TIME)
+            return state, _WIZARD_INVALID_TIME_RESPONSE
         state.data["changes"]["start_time"] = text
 
     state.step = 6
-    args = original.get("arguments", [])
-    args_display = " ".join(args) if args else ""
+    args_display = state.data["args_display"]
     return state, BotResponse(text=Messages.WIZARD_EDIT_ARGUMENTS.format(args_display))
 
 
 def _edit_step_launch_new_process(
     state: ConversationState, text: str
 ) -> tuple[ConversationState, BotResponse]:
-    original = state.data["original"]
-    if text.lower() in ("yes", "y"):
+    answer = text.lower()
+    if answer in _YES_WORDS:
         state.data["changes"]["launch_new_process"] = True
-    elif text.lower() in ("no", "n"):
+    elif answer in _NO_WORDS:
         state.data["changes"]["launch_new_process"] = False
     # skip => no change
 
     state.step = 6
-    args = original.get("arguments", [])
-    args_display = " ".join(args) if args else ""
+    args_display = state.data["args_display"]
     return state, BotResponse(text=Messages.WIZARD_EDIT_ARGUMENTS.format(args_display))
 
 
@@ -388,16 +381,17 @@ def _edit_step_arguments(
     original = state.data["original"]
     changes = state.data["changes"]
 
-    if text.lower() in ("skip", "s"):
+    answer = text.lower()
+    if answer in _KEEP_WORDS:
         pass  # no change
-    elif text.lower() in ("none", ""):
+    elif answer in _CLEAR_WORDS:
         changes["arguments"] = None
     else:
-        changes["arguments"] = shlex.split(text)
+        changes["arguments"] = split_arguments(text)
 
     state.step = 7
     if not changes:
-        return state, BotResponse(text=Messages.WIZARD_EDIT_NO_CHANGES)
+        return state, _WIZARD_EDIT_NO_CHANGES_RESPONSE
 
     diff = format_edit_changes(original, changes)
     return state, BotResponse(text=Messages.WIZARD_EDIT_CONFIRM.format(diff))
@@ -406,6 +400,32 @@ def _edit_step_arguments(
 def _edit_step_confirm(
     state: ConversationState, text: str
 ) -> tuple[Optional[ConversationState], BotResponse]:
-    if text.lower() in ("yes", "y"):
-        return None, BotResponse(text=CONFIRMED_SENTINEL)
-    return None, BotResponse(text=Messages.OPERATION_CANCELLED)
+    if text.lower() in _YES_WORDS:
+        return None, _CONFIRMED_RESPONSE
+    return None, _OPERATION_CANCELLED_RESPONSE
+
+
+# Handler for each add wizard step, indexed by state.step.
+_ADD_STEPS = (
+    _add_step_script_path,
+    _add_step_command,
+    _add_step_name,
+    _add_step_interval,
+    _add_step_start_time,
+    _add_step_launch_new_process,
+    _add_step_arguments,
+    _add_step_confirm,
+)
+
+
+# Handler for each edit wizard step, indexed by state.step.
+_EDIT_STEPS = (
+    _edit_step_script_path,
+    _edit_step_command,
+    _edit_step_name,
+    _edit_step_interval,
+    _edit_step_start_time,
+    _edit_step_launch_new_process,
+    _edit_step_arguments,
+    _edit_step_confirm,
+)
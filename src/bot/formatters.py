@@ -17,37 +17,29 @@ def format_task_list_compact(tasks: List[Dict]) -> str:
 
     lines: List[str] = []
     for task in tasks:
-        task_type = task.get("task_type", TaskTypes.SCRIPT)
         interval = task["interval"]
         interval_tag = "manual" if interval == 0 else f"{interval}min"
-        line = f"{task['id']}. {task['name']} [{interval_tag}]"
-
-        if task_type == TaskTypes.UV_COMMAND:
-            line += " [uv]"
-
-        if task.get("launch_new_process"):
-            line += " [new console]"
-
-        last_run_time = task.get("last_run_time")
-        if last_run_time:
+        uv_tag = " [uv]" if task.get("task_type") == TaskTypes.UV_COMMAND else ""
+        console_tag = " [new console]" if task.get("launch_new_process") else ""
+        if task.get("last_run_time"):
             status = "success" if task.get("last_run_success") else "failed"
-            line += f" (last: {status})"
+            last_run = f" (last: {status})"
         else:
-            line += " (never run)"
+            last_run = " (never run)"
 
-        lines.append(line)
+        lines.append(
+            f"{task['id']}. {task['name']} [{interval_tag}]"
+            f"{uv_tag}{console_tag}{last_run}"
+        )
 
     return "\n".join(lines)
 
 
 def format_task_detail(task: Dict) -> str:
     """Format a single task with full details for chat."""
-    task_type = task.get("task_type", TaskTypes.SCRIPT)
-    lines: List[str] = []
-
-    lines.append(f"Task #{task['id']}: {task['name']}")
+    lines: List[str] = [f"Task #{task['id']}: {task['name']}"]
 
-    if task_type == TaskTypes.UV_COMMAND:
+    if task.get("task_type") == TaskTypes.UV_COMMAND:
         lines.append("Type: uv command")
         lines.append(f"Project: {task['script_path']}")
         lines.append(f"Command: {task.get('command', 'N/A')}")
@@ -66,11 +58,8 @@ def format_task_detail(task: Dict) -> str:
     if task.get("launch_new_process"):
         lines.append("Launch mode: new console")
 
-    arguments = task.get("arguments", [])
-    if arguments:
-        lines.append(f"Arguments: {' '.join(arguments)}")
-    else:
-        lines.append("Arguments: None")
+    arguments = task.get("arguments")
+    lines.append(f"Arguments: {' '.join(arguments)}" if arguments else "Arguments: None")
 
     last_run_time = task.get("last_run_time")
     if last_run_time:
@@ -105,15 +94,12 @@ def format_execution_history_compact(executions: List[Dict]) -> str:
 
 def format_add_summary(data: Dict) -> str:
     """Format add wizard summary for confirmation."""
-    task_type = data.get("task_type", TaskTypes.SCRIPT)
-    lines: List[str] = []
+    lines: List[str] = [f"Name: {data['name']}"]
 
-    lines.append(f"Name: {data['name']}")
-
-    if task_type == TaskTypes.UV_COMMAND:
+    if data.get("task_type") == TaskTypes.UV_COMMAND:
         lines.append("Type: uv command")
         lines.append(f"Project: {data['script_path']}")
-        command = data.get("command", "")
+        command = data.get("command")
         if command:
             lines.append(f"Command: {command}")
     else:
@@ -131,7 +117,7 @@ def format_add_summary(data: Dict) -> str:
     if data.get("launch_new_process"):
         lines.append("Launch mode: new console")
 
-    arguments = data.get("arguments", "")
+    arguments = data.get("arguments")
     if arguments:
         lines.append(f"Arguments: {arguments}")
 
@@ -143,9 +129,9 @@ def format_edit_changes(original: Dict, changes: Dict) -> str:
     if not changes:
         return Messages.WIZARD_EDIT_NO_CHANGES
 
-    lines: List[str] = []
-    for key, new_value in changes.items():
-        old_value = original.get(key, "")
-        lines.append(f"{key}: {old_value} -> {new_value}")
+    lines = [
+        f"{key}: {original.get(key, '')} -> {new_value}"
+        for key, new_value in changes.items()
+    ]
 
     return "\n".join(lines)
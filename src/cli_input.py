@@ -1,26 +1,78 @@
-import os
-import shlex
-from datetime import datetime
-from typing import Dict, Any, Optional
-
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import PathCompleter, FuzzyCompleter
-from prompt_toolkit.key_binding import KeyBindings
+from __future__ import annotations
 
-from .formatters import format_interval, parse_interval
+import functools
+import os
+import stat
+import sys
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+from .formatters import (
+    format_interval,
+    is_valid_start_time,
+    parse_interval,
+    split_arguments,
+)
 from .script_runner import ScriptRunner
 from .constants import TaskTypes, Paths
 
+if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import Completer
+    from prompt_toolkit.key_binding import KeyBindings
+
+    from .path_completer import ThresholdCompleter
+
+
+def _read_line(prompt: str) -> str:
+    """input() for terminals; a plain stdin read when input is piped.
+
+    Raises EOFError at end of input, like input().
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
+
+
+@functools.lru_cache(maxsize=1024)
+def _stat_mode_cached(path: str) -> int:
+    """Cached st_mode of a path (0 if it cannot be stat'ed); cleared before each path prompt."""
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return 0
+
+
+def _isdir_cached(path: str) -> bool:
+    """os.path.isdir backed by the cached stat result."""
+    return stat.S_ISDIR(_stat_mode_cached(path))
+
+
+def _isfile_cached(path: str) -> bool:
+    """os.path.isfile backed by the cached stat result."""
+    return stat.S_ISREG(_stat_mode_cached(path))
+
+
+def _exists_cached(path: str) -> bool:
+    """os.path.exists backed by the cached stat result."""
+    return _stat_mode_cached(path) != 0
+
 
 def _create_path_key_bindings() -> KeyBindings:
     """Create key bindings for path input with tab completion."""
+    from prompt_toolkit.key_binding import KeyBindings
+
     kb = KeyBindings()
 
     @kb.add("enter")
     def _(event):
         if event.app.current_buffer.complete_state:
             current_text = event.app.current_buffer.text
-            if os.path.isdir(current_text):
+            if _isdir_cached(current_text):
                 new_text = current_text.rstrip("\\") + "\\"
                 event.app.current_buffer.text = new_text
                 event.app.current_buffer.cursor_position = len(new_text)
@@ -31,9 +83,26 @@ def _create_path_key_bindings() -> KeyBindings:
     return kb
 
 
+def _create_multiline_args_key_bindings() -> KeyBindings:
+    """Create key bindings where Enter on an empty line submits the prompt."""
+    from prompt_toolkit.key_binding import KeyBindings
+
+    kb = KeyBindings()
+
+    @kb.add("enter")
+    def _(event):
+        buffer = event.app.current_buffer
+        if buffer.document.current_line.strip():
+            buffer.insert_text("\n")
+        else:
+            buffer.validate_and_handle()
+
+    return kb
+
+
 def _get_script_path(
     session: PromptSession,
-    completer: FuzzyCompleter,
+    completer: ThresholdCompleter,
     kb: KeyBindings,
     existing_task: Optional[Dict[str, Any]],
     script_runner: ScriptRunner,
@@ -44,17 +113,22 @@ def _get_script_path(
     Returns:
         Tuple of (script_path, task_type, command)
     """
+    keep_hint = "\n(Enter = keep current)" if existing_task else ""
+    prompt_text = (
+        f"\nScript path or uv project directory (Use Tab for suggestions){keep_hint}:"
+    )
+
     while True:
-        prompt_text = "\nScript path or uv project directory (Use Tab for suggestions)"
-        if existing_task:
-            prompt_text += "\n(Enter = keep current)"
-        prompt_text += ":"
+        # Re-stat on every attempt so files created after an error are picked up
+        _stat_mode_cached.cache_clear()
+
         print(prompt_text)
 
         path_input = session.prompt(
             "Path: ",
             completer=completer,
             key_bindings=kb,
+            multiline=False,
             default=existing_task["script_path"] if existing_task else "",
         ).strip()
 
@@ -67,11 +141,11 @@ def _get_script_path(
             )
 
         # Check if it's a uv project directory
-        if os.path.isdir(path_input):
+        if _isdir_cached(path_input):
             pyproject_path = os.path.join(path_input, Paths.PYPROJECT_TOML)
             uv_lock_path = os.path.join(path_input, Paths.UV_LOCK)
 
-            if os.path.exists(pyproject_path) and os.path.exists(uv_lock_path):
+            if _exists_cached(pyproject_path) and _exists_cached(uv_lock_path):
                 result = _handle_uv_project(path_input, script_runner)
                 if result:
                     return (path_input, result[0], result[1])
@@ -86,7 +160,7 @@ def _get_script_path(
                 continue
 
         # Check if it's a file
-        if os.path.isfile(path_input):
+        if _isfile_cached(path_input):
             return (path_input, TaskTypes.SCRIPT, None)
 
         print(
@@ -109,7 +183,7 @@ def _handle_uv_project(path_input: str, script_runner: ScriptRunner) -> Optional
 
     if not has_predefined and not has_discovered:
         print("\nDetected uv project! No predefined or discovered commands found.")
-        custom_cmd = input(
+        custom_cmd = _read_line(
             "Enter custom command (e.g., python -m module_name): "
         ).strip()
         if custom_cmd:
@@ -142,13 +216,13 @@ def _handle_uv_project(path_input: str, script_runner: ScriptRunner) -> Optional
     print(f"  {custom_idx}. [Custom command]")
 
     while True:
-        cmd_input = input(f"\nSelect command [1-{custom_idx}]: ").strip()
+        cmd_input = _read_line(f"\nSelect command [1-{custom_idx}]: ").strip()
         try:
             choice = int(cmd_input)
             if 1 <= choice <= len(options):
                 return (TaskTypes.UV_COMMAND, options[choice - 1][0])
             elif choice == custom_idx:
-                custom_cmd = input(
+                custom_cmd = _read_line(
                     "Enter custom command (e.g., python -m module_name): "
                 ).strip()
                 if custom_cmd:
@@ -160,6 +234,75 @@ def _handle_uv_project(path_input: str, script_runner: ScriptRunner) -> Optional
             print("Error: Please enter a valid number.")
 
 
+# Prompt objects are built on first use and shared by later calls; the
+# completer revalidates its listings by mtime, so reuse cannot go stale.
+# The session remembers per-prompt settings, so every prompt on it passes
+# its completer, key bindings and multiline flag explicitly.
+@functools.lru_cache(maxsize=1)
+def _get_prompt_session() -> PromptSession:
+    """Shared PromptSession for interactive task input."""
+    # prompt_toolkit is only needed for interactive input, so import it here
+    from prompt_toolkit import PromptSession
+
+    return PromptSession()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_path_completer() -> ThresholdCompleter:
+    """Shared completer for the script path prompt."""
+    from .path_completer import CachedPathCompleter, ThresholdCompleter
+
+    return ThresholdCompleter(CachedPathCompleter(expanduser=True))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_path_key_bindings() -> KeyBindings:
+    """Shared key bindings for the script path prompt."""
+    return _create_path_key_bindings()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_multiline_args_key_bindings() -> KeyBindings:
+    """Shared key bindings for the multi-line arguments prompt."""
+    return _create_multiline_args_key_bindings()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_plain_completer() -> Completer:
+    """Completer that offers nothing, for prompts without suggestions."""
+    from prompt_toolkit.completion import DummyCompleter
+
+    return DummyCompleter()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_plain_key_bindings() -> KeyBindings:
+    """Empty key bindings, leaving prompt_toolkit's defaults in effect."""
+    from prompt_toolkit.key_binding import KeyBindings
+
+    return KeyBindings()
+
+
+def _prompt_line(session: PromptSession, message: str) -> str:
+    """Prompt for one plain line of text on the shared session.
+
+    PromptSession remembers the completer, key bindings and multiline flag
+    passed to earlier prompts, so they are reset here explicitly.
+    """
+    return session.prompt(
+        message,
+        completer=_get_plain_completer(),
+        key_bindings=_get_plain_key_bindings(),
+        multiline=False,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_script_runner() -> ScriptRunner:
+    """Shared ScriptRunner used to look up uv project commands."""
+    return ScriptRunner()
+
+
 def get_task_input(existing_task: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get task details interactively from user.
@@ -171,11 +314,13 @@ def get_task_input(existing_task: Optional[Dict[str, Any]] = None) -> Dict[str,
         Dictionary with task details: script_path, name, interval, arguments,
         task_type, command, start_time
     """
-    kb = _create_path_key_bindings()
-    path_completer = PathCompleter(get_paths=lambda: ["."], expanduser=True)
-    completer = FuzzyCompleter(path_completer)
-    session = PromptSession()
-    script_runner = ScriptRunner()
+    # Drop stat results from earlier prompts so freshly created files are seen
+    _stat_mode_cached.cache_clear()
+
+    kb = _get_path_key_bindings()
+    completer = _get_path_completer()
+    session = _get_prompt_session()
+    script_runner = _get_script_runner()
 
     if existing_task:
         task_type = existing_task.get("task_type", TaskTypes.SCRIPT)
@@ -208,21 +353,21 @@ def get_task_input(existing_task: Optional[Dict[str, Any]] = None) -> Dict[str,
     )
 
     # Get task name
-    name = _get_task_name(existing_task, command)
+    name = _get_task_name(session, existing_task, command)
 
     # Get interval
-    interval = _get_interval(existing_task)
+    interval = _get_interval(session, existing_task)
 
     # Get start time and launch_new_process (skip based on interval)
     if interval == 0:
         start_time = None
-        launch_new_process = _get_launch_new_process(existing_task)
+        launch_new_process = _get_launch_new_process(session, existing_task)
     else:
-        start_time = _get_start_time(existing_task)
+        start_time = _get_start_time(session, existing_task)
         launch_new_process = False
 
     # Get arguments
-    arguments = _get_arguments(session, kb, existing_task)
+    arguments = _get_arguments(session, existing_task)
 
     return {
         "script_path": script_path,
@@ -237,31 +382,35 @@ def get_task_input(existing_task: Optional[Dict[str, Any]] = None) -> Dict[str,
 
 
 def _get_task_name(
+    session: PromptSession,
     existing_task: Optional[Dict[str, Any]],
     command: Optional[str],
 ) -> str:
     """Get task name from user input."""
     default_name = command if command else ""
-    prompt_text = "\nTask name"
     if existing_task:
-        prompt_text += f" (Enter = keep '{existing_task['name']}')"
+        hint = f" (Enter = keep '{existing_task['name']}')"
     elif default_name:
-        prompt_text += f" [{default_name}]"
-    prompt_text += ": "
+        hint = f" [{default_name}]"
+    else:
+        hint = ""
+    prompt_text = f"\nTask name{hint}: "
 
-    name = input(prompt_text).strip()
+    name = _prompt_line(session, prompt_text).strip()
     if existing_task and not name:
         name = existing_task["name"]
     elif not name and default_name:
         name = default_name
     while not name:
         print("Error: Name cannot be empty.")
-        name = input(prompt_text).strip()
+        name = _prompt_line(session, prompt_text).strip()
 
     return name
 
 
-def _get_interval(existing_task: Optional[Dict[str, Any]]) -> int:
+def _get_interval(
+    session: PromptSession, existing_task: Optional[Dict[str, Any]]
+) -> int:
     """Get interval in minutes from user input.
 
     Accepts bare minutes (e.g. "5") or suffixed values (e.g. "4h", "7d").
@@ -273,15 +422,13 @@ def _get_interval(existing_task: Optional[Dict[str, Any]]) -> int:
     print("  1w  = 1 week")
     print("  0   = manual only")
 
-    while True:
-        prompt_text = "Interval"
-        if existing_task:
-            prompt_text += (
-                f" (Enter = keep {format_interval(existing_task['interval'])})"
-            )
-        prompt_text += ": "
+    if existing_task:
+        prompt_text = f"Interval (Enter = keep {format_interval(existing_task['interval'])}): "
+    else:
+        prompt_text = "Interval: "
 
-        interval_input = input(prompt_text).strip()
+    while True:
+        interval_input = _prompt_line(session, prompt_text).strip()
         if existing_task and not interval_input:
             return existing_task["interval"]
 
@@ -291,42 +438,74 @@ def _get_interval(existing_task: Optional[Dict[str, Any]]) -> int:
             print(f"Error: {exc}")
 
 
-def _get_start_time(existing_task: Optional[Dict[str, Any]]) -> Optional[str]:
+def _get_start_time(
+    session: PromptSession, existing_task: Optional[Dict[str, Any]]
+) -> Optional[str]:
     """Get optional start time in HH:MM format from user input."""
-    while True:
-        prompt_text = "\nStart time (optional, HH:MM format for aligned scheduling)"
-        if existing_task and existing_task.get("start_time"):
-            prompt_text += f" (Enter = keep '{existing_task['start_time']}')"
-        prompt_text += ": "
+    if existing_task and existing_task.get("start_time"):
+        hint = f" (Enter = keep '{existing_task['start_time']}')"
+    else:
+        hint = ""
+    prompt_text = f"\nStart time (optional, HH:MM format for aligned scheduling){hint}: "
 
-        start_time_input = input(prompt_text).strip()
+    while True:
+        start_time_input = _prompt_line(session, prompt_text).strip()
         if existing_task and not start_time_input:
             return existing_task.get("start_time")
         elif not start_time_input:
             return None
 
-        try:
-            datetime.strptime(start_time_input, "%H:%M")
+        if is_valid_start_time(start_time_input):
             return start_time_input
-        except ValueError:
-            print("Error: Please enter time in HH:MM format (e.g., 09:00).")
+        print("Error: Please enter time in HH:MM format (e.g., 09:00).")
 
 
-def _get_launch_new_process(existing_task: Optional[Dict[str, Any]]) -> bool:
+def _get_launch_new_process(
+    session: PromptSession, existing_task: Optional[Dict[str, Any]]
+) -> bool:
     """Get launch_new_process preference from user input."""
     default = existing_task.get("launch_new_process", False) if existing_task else False
     default_hint = "Y/n" if default else "y/N"
     prompt_text = f"\nLaunch in new console window? ({default_hint}): "
 
-    answer = input(prompt_text).strip().lower()
+    answer = _prompt_line(session, prompt_text).strip().lower()
     if not answer:
         return default
     return answer in ("y", "yes")
 
 
+def _read_argument_text(session: Optional[PromptSession] = None) -> str:
+    """Read a block of arguments and join its non-blank lines with spaces.
+
+    Piped input is read up to its first blank line, where the interactive
+    prompt would finish, without starting prompt_toolkit. Returns an empty
+    string when nothing was entered.
+    """
+    if not sys.stdin.isatty():
+        lines = []
+        for line in iter(sys.stdin.readline, ""):
+            line = line.strip()
+            if not line:
+                break
+            lines.append(line)
+        return " ".join(lines)
+
+    if session is None:
+        session = _get_prompt_session()
+
+    # One multi-line prompt for the whole block instead of one prompt per line
+    text = session.prompt(
+        "> ",
+        multiline=True,
+        prompt_continuation="> ",
+        completer=_get_plain_completer(),
+        key_bindings=_get_multiline_args_key_bindings(),
+    )
+    return " ".join(line.strip() for line in text.splitlines() if line.strip())
+
+
 def _get_arguments(
     session: PromptSession,
-    kb: KeyBindings,
     existing_task: Optional[Dict[str, Any]],
 ) -> Optional[list]:
     """Get optional arguments from user input."""
@@ -337,17 +516,12 @@ def _get_arguments(
         print("\nEnter arguments (press Enter twice to finish):")
         print('Example: --source "path/to/source" --target "path/to/target"')
 
+    text = _read_argument_text(session)
+
     args = None
-    arg_lines = []
-    while True:
-        arg = session.prompt("> ", key_bindings=kb).strip()
-
-        if not arg:
-            if not arg_lines and existing_task:
-                args = shlex.split(" ".join(existing_task["arguments"]))
-            elif arg_lines:
-                args = shlex.split(" ".join(arg_lines))
-            break
-        arg_lines.append(arg)
+    if text:
+        args = split_arguments(text)
+    elif existing_task:
+        args = list(existing_task["arguments"])
 
     return args if args else None
@@ -1,34 +1,31 @@
-from .lifecycle import handle_shutdown
-from .query import handle_ftp_sync, handle_history, handle_list, handle_run_id
-from .task_crud import (
-    handle_add,
-    handle_copy_task,
-    handle_delete,
-    handle_edit,
-    handle_script,
-    handle_uv_command,
-)
-from .task_settings import (
-    handle_rename,
-    handle_set_arguments,
-    handle_set_interval,
-    handle_set_start_time,
-)
+import importlib
 
-__all__ = [
-    "handle_add",
-    "handle_copy_task",
-    "handle_delete",
-    "handle_edit",
-    "handle_ftp_sync",
-    "handle_history",
-    "handle_list",
-    "handle_rename",
-    "handle_run_id",
-    "handle_script",
-    "handle_shutdown",
-    "handle_set_arguments",
-    "handle_set_interval",
-    "handle_set_start_time",
-    "handle_uv_command",
-]
+# Handler name -> submodule that defines it. Submodules are imported on first
+# access so a command only pays for the imports of its own module.
+_HANDLER_MODULES = {
+    "handle_add": "task_crud",
+    "handle_copy_task": "task_crud",
+    "handle_delete": "task_crud",
+    "handle_edit": "task_crud",
+    "handle_ftp_sync": "query",
+    "handle_history": "query",
+    "handle_list": "query",
+    "handle_rename": "task_settings",
+    "handle_run_id": "query",
+    "handle_script": "task_crud",
+    "handle_shutdown": "lifecycle",
+    "handle_set_arguments": "task_settings",
+    "handle_set_interval": "task_settings",
+    "handle_set_start_time": "task_settings",
+    "handle_uv_command": "task_crud",
+}
+
+__all__ = sorted(_HANDLER_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
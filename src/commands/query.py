@@ -1,19 +1,20 @@
+from __future__ import annotations
+
 import sys
+from typing import TYPE_CHECKING
 
 from ..cli_output import CliOutput
 from ..config import Config
 from ..formatters import format_execution_history, format_task_list
 from ..interaction import CliInteractionHandler, ConsoleScriptOutput
-from ..scheduler import TaskScheduler
-from ..status_page import StatusPage
+
+if TYPE_CHECKING:
+    from ..scheduler import TaskScheduler
 
 
 def handle_list(scheduler: TaskScheduler, cli: CliOutput, filter_term: str) -> None:
     """List scheduled tasks and exit."""
-    tasks = scheduler.list_tasks()
-    if filter_term:
-        filter_lower = filter_term.lower()
-        tasks = [t for t in tasks if filter_lower in t["name"].lower()]
+    tasks = scheduler.list_tasks(name_filter=filter_term or None)
     cli.info("Scheduled tasks:" + format_task_list(tasks, show_next_run=False))
 
 
@@ -25,8 +26,7 @@ def handle_history(scheduler: TaskScheduler, cli: CliOutput, count: int) -> None
 
 def handle_run_id(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> None:
     """Run a specific task by its ID."""
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
@@ -60,6 +60,8 @@ def handle_run_id(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> Non
 
 def handle_ftp_sync(cli: CliOutput, config: Config) -> None:
     """Manually trigger FTP sync of the status page."""
+    from ..status_page import StatusPage
+
     status_page = StatusPage()
     cli.info(f"Starting FTP sync from {status_page.get_output_dir()}")
 
@@ -1,12 +1,24 @@
+from __future__ import annotations
+
+import functools
 import os
 import sys
 from argparse import Namespace
+from typing import TYPE_CHECKING, List, Optional
 
-from ..cli_input import get_task_input
+from ..cli_input import _read_line, get_task_input
 from ..cli_output import CliOutput
 from ..constants import Paths, TaskTypes
-from ..formatters import format_interval, format_task_list
-from ..scheduler import TaskScheduler
+from ..formatters import format_interval, format_task, is_valid_start_time
+
+if TYPE_CHECKING:
+    from ..scheduler import TaskScheduler
+
+
+@functools.lru_cache(maxsize=256)
+def _abs_path(path: str) -> str:
+    """Cached os.path.abspath; the working directory is fixed for a CLI run."""
+    return os.path.abspath(path)
 
 
 def _log_task_details(cli: CliOutput, task_details: dict) -> None:
@@ -35,7 +47,7 @@ def handle_add(scheduler: TaskScheduler, cli: CliOutput) -> None:
 
     scheduler.add_task(
         name=task_details["name"],
-        script_path=os.path.abspath(task_details["script_path"]),
+        script_path=_abs_path(task_details["script_path"]),
         interval=task_details["interval"],
         arguments=task_details["arguments"],
         task_type=task_details.get("task_type", TaskTypes.SCRIPT),
@@ -50,15 +62,14 @@ def handle_add(scheduler: TaskScheduler, cli: CliOutput) -> None:
 
 def handle_edit(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> None:
     """Edit a task interactively."""
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
         sys.exit(1)
 
     cli.info("\nEditing task:")
-    cli.info(format_task_list([task], show_next_run=False))
+    cli.info(format_task(task, show_next_run=False))
 
     task_details = get_task_input(task)
 
@@ -66,7 +77,7 @@ def handle_edit(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> None:
         scheduler.edit_task(
             task_id=task_id,
             name=task_details["name"],
-            script_path=os.path.abspath(task_details["script_path"]),
+            script_path=_abs_path(task_details["script_path"]),
             interval=task_details["interval"],
             arguments=task_details["arguments"],
             task_type=task_details.get("task_type", TaskTypes.SCRIPT),
@@ -83,17 +94,16 @@ def handle_edit(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> None:
 
 def handle_delete(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> None:
     """Delete a task by ID after confirmation."""
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
         sys.exit(1)
 
     cli.info("\nTask to delete:")
-    cli.info(format_task_list([task], show_next_run=False))
+    cli.info(format_task(task, show_next_run=False))
 
-    confirmation = input("\nAre you sure you want to delete this task? (y/N): ")
+    confirmation = _read_line("\nAre you sure you want to delete this task? (y/N): ")
     if confirmation.lower() == "y":
         try:
             scheduler.remove_task(task_id)
@@ -105,13 +115,13 @@ def handle_delete(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> Non
         cli.info("Deletion cancelled")
 
 
-def handle_script(scheduler: TaskScheduler, cli: CliOutput, args) -> None:
-    """Add a new task via CLI arguments."""
+def _validate_name_and_interval(cli: CliOutput, args: Namespace) -> None:
+    """Exit unless --name and a non-negative --interval were given."""
     if not args.name:
         cli.error("--name is required when adding a new task")
         sys.exit(1)
 
-    if not args.interval:
+    if args.interval is None:
         cli.error("--interval is required when adding a new task")
         sys.exit(1)
 
@@ -119,33 +129,42 @@ def handle_script(scheduler: TaskScheduler, cli: CliOutput, args) -> None:
         cli.error("Interval must be 0 or higher. Use 0 for manual-only tasks.")
         sys.exit(1)
 
-    start_time = None
-    if args.start_time:
-        if args.interval == 0:
-            cli.error("Start time is not applicable for manual-only tasks (interval 0).")
-            sys.exit(1)
-        try:
-            from datetime import datetime
-
-            datetime.strptime(args.start_time, "%H:%M")
-            start_time = args.start_time
-        except ValueError:
-            cli.error(
-                f"Invalid start time format: {args.start_time}. Use HH:MM format (e.g., 09:00)."
-            )
-            sys.exit(1)
+
+def _parse_start_time(cli: CliOutput, args: Namespace) -> Optional[str]:
+    """Return --start-time if given, exiting when it is not a valid HH:MM time."""
+    if not args.start_time:
+        return None
+    if not is_valid_start_time(args.start_time):
+        cli.error(
+            f"Invalid start time format: {args.start_time}. Use HH:MM format (e.g., 09:00)."
+        )
+        sys.exit(1)
+    return args.start_time
+
+
+def _strip_leading_dashdash(script_args: List[str]) -> List[str]:
+    """Drop the "--" separator that parse_arguments keeps in script_args."""
+    if script_args and script_args[0] == "--":
+        return script_args[1:]
+    return script_args
+
+
+def handle_script(scheduler: TaskScheduler, cli: CliOutput, args) -> None:
+    """Add a new task via CLI arguments."""
+    _validate_name_and_interval(cli, args)
+
+    if args.start_time and args.interval == 0:
+        cli.error("Start time is not applicable for manual-only tasks (interval 0).")
+        sys.exit(1)
+    start_time = _parse_start_time(cli, args)
 
     launch_new_process = getattr(args, "launch_new_process", False)
     if launch_new_process and args.interval != 0:
         cli.error("--launch-new-process is only valid for manual tasks (interval 0).")
         sys.exit(1)
 
-    script_path = os.path.abspath(args.script)
-    script_args = (
-        args.script_args[1:]
-        if args.script_args and args.script_args[0] == "--"
-        else args.script_args
-    )
+    script_path = args.script  # already made absolute by argparse
+    script_args = _strip_leading_dashdash(args.script_args)
 
     scheduler.add_task(
         args.name,
@@ -169,8 +188,7 @@ def handle_script(scheduler: TaskScheduler, cli: CliOutput, args) -> None:
 
 def handle_copy_task(scheduler: TaskScheduler, cli: CliOutput, task_id: int) -> None:
     """Copy an existing task."""
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
@@ -199,17 +217,9 @@ def handle_uv_command(
     scheduler: TaskScheduler, cli: CliOutput, args: Namespace
 ) -> None:
     """Add a new uv command task via CLI arguments."""
-    if not args.name:
-        cli.error("--name is required when adding a new task")
-        sys.exit(1)
-
-    if args.interval is None:
-        cli.error("--interval is required when adding a new task")
-        sys.exit(1)
+    _validate_name_and_interval(cli, args)
 
-    if args.interval < 0:
-        cli.error("Interval must be 0 or higher. Use 0 for manual-only tasks.")
-        sys.exit(1)
+    start_time = _parse_start_time(cli, args)
 
     project_dir, command_name = args.uv_command
 
@@ -229,24 +239,7 @@ def handle_uv_command(
         )
         sys.exit(1)
 
-    start_time = None
-    if args.start_time:
-        try:
-            from datetime import datetime
-
-            datetime.strptime(args.start_time, "%H:%M")
-            start_time = args.start_time
-        except ValueError:
-            cli.error(
-                f"Invalid start time format: {args.start_time}. Use HH:MM format (e.g., 09:00)."
-            )
-            sys.exit(1)
-
-    script_args = (
-        args.script_args[1:]
-        if args.script_args and args.script_args[0] == "--"
-        else args.script_args
-    )
+    script_args = _strip_leading_dashdash(args.script_args)
 
     scheduler.add_task(
         name=args.name,
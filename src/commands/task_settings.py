@@ -1,15 +1,20 @@
-import shlex
-import sys
-from datetime import datetime
-from typing import List
+from __future__ import annotations
 
-from prompt_toolkit import PromptSession
+import sys
+from typing import TYPE_CHECKING
 
-from ..cli_input import _create_path_key_bindings
+from ..cli_input import _get_prompt_session, _prompt_line, _read_argument_text
 from ..cli_output import CliOutput
 from ..constants import TaskTypes
-from ..formatters import format_interval, parse_interval
-from ..scheduler import TaskScheduler
+from ..formatters import (
+    format_interval,
+    is_valid_start_time,
+    parse_interval,
+    split_arguments,
+)
+
+if TYPE_CHECKING:
+    from ..scheduler import TaskScheduler
 
 
 def handle_set_start_time(
@@ -22,8 +27,7 @@ def handle_set_start_time(
         cli.error(f"Invalid task ID: {task_id_str}")
         sys.exit(1)
 
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
@@ -31,15 +35,13 @@ def handle_set_start_time(
 
     if time_value.lower() == "none":
         new_start_time = None
+    elif is_valid_start_time(time_value):
+        new_start_time = time_value
     else:
-        try:
-            datetime.strptime(time_value, "%H:%M")
-            new_start_time = time_value
-        except ValueError:
-            cli.error(
-                f"Invalid time format: {time_value}. Use HH:MM format or 'none' to clear."
-            )
-            sys.exit(1)
+        cli.error(
+            f"Invalid time format: {time_value}. Use HH:MM format or 'none' to clear."
+        )
+        sys.exit(1)
 
     try:
         scheduler.edit_task(
@@ -80,8 +82,7 @@ def handle_set_interval(
         cli.error(str(exc))
         sys.exit(1)
 
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
@@ -134,8 +135,7 @@ def handle_rename(
         task_id: Numeric task ID.
         new_name: New name for the task. When None, prompts interactively.
     """
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
@@ -148,8 +148,7 @@ def handle_rename(
         cli.info(f"Current name: {old_name}")
         cli.info("\nEnter new name (press Enter to keep current):")
 
-        session = PromptSession()
-        reply = session.prompt("> ").strip()
+        reply = _prompt_line(_get_prompt_session(), "> ").strip()
         new_name = reply if reply else old_name
 
     try:
@@ -174,8 +173,7 @@ def handle_set_arguments(
     scheduler: TaskScheduler, cli: CliOutput, task_id: int
 ) -> None:
     """Interactively set arguments for a task."""
-    tasks = scheduler.list_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = scheduler.get_task(task_id)
 
     if not task:
         cli.error(f"No task found with ID {task_id}")
@@ -188,23 +186,14 @@ def handle_set_arguments(
     cli.info("\nEnter new arguments (press Enter to keep current, type 'none' to clear):")
     cli.info('Example: --source "path/to/source" --target "path/to/target"')
 
-    kb = _create_path_key_bindings()
-    session = PromptSession()
+    full_input = _read_argument_text()
+
     new_arguments = None
-    arg_lines: List[str] = []
-    while True:
-        arg = session.prompt("> ", key_bindings=kb).strip()
-        if not arg:
-            if not arg_lines and task["arguments"]:
-                new_arguments = task["arguments"]
-            elif arg_lines:
-                full_input = " ".join(arg_lines)
-                if full_input.lower() == "none":
-                    new_arguments = None
-                else:
-                    new_arguments = shlex.split(full_input)
-            break
-        arg_lines.append(arg)
+    if full_input:
+        if full_input.lower() != "none":
+            new_arguments = split_arguments(full_input)
+    elif task["arguments"]:
+        new_arguments = task["arguments"]
 
     try:
         scheduler.edit_task(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import configparser
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 if TYPE_CHECKING:
     from .bot.command_processor import BotConfig
@@ -41,6 +41,21 @@ class Config:
 
         self._initialized = True
 
+    @property
+    def config(self) -> configparser.ConfigParser:
+        """The underlying ConfigParser."""
+        return self._config
+
+    @config.setter
+    def config(self, parser: configparser.ConfigParser):
+        self._config = parser
+        self._drop_cached_settings()
+
+    def _drop_cached_settings(self):
+        """Forget section values parsed from the current parser."""
+        self._bot_settings: Optional[Dict[str, str]] = None
+        self._ftp_settings: Optional[Dict] = None
+
     def _create_default_config(self):
         """Create default configuration file."""
         self.config[ConfigConstants.SECTION_LOGGING] = {
@@ -79,8 +94,7 @@ class Config:
             InteractiveConstants.KEY_TIMEOUT: str(InteractiveConstants.DEFAULT_TIMEOUT),
         }
 
-        with open(self.config_path, "w") as configfile:
-            self.config.write(configfile)
+        self._save_config()
 
     def get_logging_level(self) -> str:
         """Get the current logging level."""
@@ -97,11 +111,12 @@ class Config:
         Args:
             level: One of DEBUG, INFO, WARNING, ERROR
         """
-        if level not in ["DEBUG", "INFO", "WARNING", "ERROR"]:
+        if level not in ConfigConstants.VALID_LEVELS:
             raise ValueError("Invalid logging level")
 
-        self.config[ConfigConstants.SECTION_LOGGING][ConfigConstants.KEY_LEVEL] = level
-        self._save_config()
+        self._update_section(
+            ConfigConstants.SECTION_LOGGING, {ConfigConstants.KEY_LEVEL: level}
+        )
 
     def is_detailed_logging_enabled(self) -> bool:
         """Check if detailed argument logging is enabled."""
@@ -126,16 +141,37 @@ class Config:
         Args:
             enabled: True to enable detailed logging, False to disable
         """
-        self.config[ConfigConstants.SECTION_LOGGING][
-            ConfigConstants.KEY_DETAILED_ARGS
-        ] = str(enabled).lower()
-        self._save_config()
+        self._update_section(
+            ConfigConstants.SECTION_LOGGING,
+            {ConfigConstants.KEY_DETAILED_ARGS: str(enabled).lower()},
+        )
 
     def _save_config(self):
         """Save current configuration to file."""
+        self._drop_cached_settings()
         with open(self.config_path, "w") as configfile:
             self.config.write(configfile)
 
+    def _update_section(self, section: str, values: Dict[str, str]):
+        """
+        Store values in a section, saving the file only if one actually changed.
+
+        Args:
+            section: Section to update; created if missing
+            values: Option name -> new string value
+        """
+        self._ensure_section(section)
+        current = self.config[section]
+        changed = {
+            key: value
+            for key, value in values.items()
+            if current.get(key, raw=True) != value
+        }
+        if not changed:
+            return
+        current.update(changed)
+        self._save_config()
+
     # StatusPage configuration methods
     def get_output_type(self) -> str:
         """Get the status page output type (html or php)."""
@@ -147,13 +183,12 @@ class Config:
 
     def set_output_type(self, output_type: str):
         """Set the status page output type."""
-        if output_type not in ["html", "php"]:
+        if output_type not in ConfigConstants.VALID_OUTPUT_TYPES:
             raise ValueError("Invalid output type. Must be 'html' or 'php'")
-        self._ensure_section(ConfigConstants.SECTION_STATUS_PAGE)
-        self.config[ConfigConstants.SECTION_STATUS_PAGE][
-            ConfigConstants.KEY_OUTPUT_TYPE
-        ] = output_type
-        self._save_config()
+        self._update_section(
+            ConfigConstants.SECTION_STATUS_PAGE,
+            {ConfigConstants.KEY_OUTPUT_TYPE: output_type},
+        )
 
     def get_output_path(self) -> str:
         """Get the status page output path."""
@@ -165,11 +200,10 @@ class Config:
 
     def set_output_path(self, path: str):
         """Set the status page output path."""
-        self._ensure_section(ConfigConstants.SECTION_STATUS_PAGE)
-        self.config[ConfigConstants.SECTION_STATUS_PAGE][
-            ConfigConstants.KEY_OUTPUT_PATH
-        ] = path
-        self._save_config()
+        self._update_section(
+            ConfigConstants.SECTION_STATUS_PAGE,
+            {ConfigConstants.KEY_OUTPUT_PATH: path},
+        )
 
     def get_php_password(self) -> str:
         """Get the PHP login password."""
@@ -181,11 +215,10 @@ class Config:
 
     def set_php_password(self, password: str):
         """Set the PHP login password."""
-        self._ensure_section(ConfigConstants.SECTION_STATUS_PAGE)
-        self.config[ConfigConstants.SECTION_STATUS_PAGE][
-            ConfigConstants.KEY_PHP_PASSWORD
-        ] = password
-        self._save_config()
+        self._update_section(
+            ConfigConstants.SECTION_STATUS_PAGE,
+            {ConfigConstants.KEY_PHP_PASSWORD: password},
+        )
 
     def get_php_login_library_path(self) -> str:
         """Get the path to php-simple-login library."""
@@ -197,11 +230,10 @@ class Config:
 
     def set_php_login_library_path(self, path: str):
         """Set the path to php-simple-login library."""
-        self._ensure_section(ConfigConstants.SECTION_STATUS_PAGE)
-        self.config[ConfigConstants.SECTION_STATUS_PAGE][
-            ConfigConstants.KEY_PHP_LOGIN_LIBRARY_PATH
-        ] = path
-        self._save_config()
+        self._update_section(
+            ConfigConstants.SECTION_STATUS_PAGE,
+            {ConfigConstants.KEY_PHP_LOGIN_LIBRARY_PATH: path},
+        )
 
     # FTP configuration methods
     def is_ftp_enabled(self) -> bool:
@@ -211,7 +243,18 @@ class Config:
         )
 
     def get_ftp_settings(self) -> Dict:
-        """Get all FTP settings as a dictionary."""
+        """
+        Get all FTP settings as a dictionary.
+
+        The values are parsed once and cached until the parser is replaced or
+        a setter changes it; each call returns a fresh copy.
+        """
+        if self._ftp_settings is None:
+            self._ftp_settings = self._read_ftp_settings()
+        return dict(self._ftp_settings)
+
+    def _read_ftp_settings(self) -> Dict:
+        """Parse the FTP section into typed values."""
         return {
             "enabled": self.is_ftp_enabled(),
             "host": self.config.get(
@@ -253,40 +296,26 @@ class Config:
 
     def set_ftp_settings(self, settings: Dict):
         """Set FTP settings from a dictionary."""
-        self._ensure_section(ConfigConstants.SECTION_FTP)
+        values = {}
         if "enabled" in settings:
-            self.config[ConfigConstants.SECTION_FTP][
-                ConfigConstants.KEY_FTP_ENABLED
-            ] = str(settings["enabled"]).lower()
+            values[ConfigConstants.KEY_FTP_ENABLED] = str(settings["enabled"]).lower()
         if "host" in settings:
-            self.config[ConfigConstants.SECTION_FTP][ConfigConstants.KEY_FTP_HOST] = (
-                settings["host"]
-            )
+            values[ConfigConstants.KEY_FTP_HOST] = settings["host"]
         if "port" in settings:
-            self.config[ConfigConstants.SECTION_FTP][ConfigConstants.KEY_FTP_PORT] = (
-                str(settings["port"])
-            )
+            values[ConfigConstants.KEY_FTP_PORT] = str(settings["port"])
         if "username" in settings:
-            self.config[ConfigConstants.SECTION_FTP][
-                ConfigConstants.KEY_FTP_USERNAME
-            ] = settings["username"]
+            values[ConfigConstants.KEY_FTP_USERNAME] = settings["username"]
         if "password" in settings:
-            self.config[ConfigConstants.SECTION_FTP][
-                ConfigConstants.KEY_FTP_PASSWORD
-            ] = settings["password"]
+            values[ConfigConstants.KEY_FTP_PASSWORD] = settings["password"]
         if "remote_path" in settings:
-            self.config[ConfigConstants.SECTION_FTP][
-                ConfigConstants.KEY_FTP_REMOTE_PATH
-            ] = settings["remote_path"]
+            values[ConfigConstants.KEY_FTP_REMOTE_PATH] = settings["remote_path"]
         if "passive_mode" in settings:
-            self.config[ConfigConstants.SECTION_FTP][
-                ConfigConstants.KEY_FTP_PASSIVE_MODE
-            ] = str(settings["passive_mode"]).lower()
+            values[ConfigConstants.KEY_FTP_PASSIVE_MODE] = str(
+                settings["passive_mode"]
+            ).lower()
         if "timeout" in settings:
-            self.config[ConfigConstants.SECTION_FTP][
-                ConfigConstants.KEY_FTP_TIMEOUT
-            ] = str(settings["timeout"])
-        self._save_config()
+            values[ConfigConstants.KEY_FTP_TIMEOUT] = str(settings["timeout"])
+        self._update_section(ConfigConstants.SECTION_FTP, values)
 
     def get_ftp_sync_interval(self) -> int:
         """Get minimum minutes between FTP syncs (0 = sync every time)."""
@@ -297,12 +326,23 @@ class Config:
         )
 
     # Bot configuration methods
+    def _get_bot_settings(self) -> Dict[str, str]:
+        """
+        Get the bot section as a plain dict, read once and cached.
+
+        The cache is dropped whenever the parser is replaced or saved.
+        """
+        if self._bot_settings is None:
+            if self.config.has_section(BotConstants.SECTION):
+                self._bot_settings = dict(self.config[BotConstants.SECTION])
+            else:
+                self._bot_settings = {}
+        return self._bot_settings
+
     def get_bot_type(self) -> str:
         """Get the configured bot type (none, telegram, or xmpp)."""
-        return self.config.get(
-            BotConstants.SECTION,
-            BotConstants.KEY_TYPE,
-            fallback=BotConstants.DEFAULT_TYPE,
+        return self._get_bot_settings().get(
+            BotConstants.KEY_TYPE, BotConstants.DEFAULT_TYPE
         )
 
     def get_bot_setting(self, key: str, fallback: str = "") -> str:
@@ -312,7 +352,7 @@ class Config:
             key: The configuration key to retrieve.
             fallback: Value to return if the key is not found.
         """
-        return self.config.get(BotConstants.SECTION, key, fallback=fallback)
+        return self._get_bot_settings().get(self.config.optionxform(key), fallback)
 
     def is_bot_command_allowed(self, command: str) -> bool:
         """Check if a bot command is allowed.
@@ -52,6 +52,7 @@ class Config:
     DEFAULT_LEVEL = "INFO"
     DEFAULT_DETAILED = "false"
     DEFAULT_CONSOLE_LOGGING = "false"
+    VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
 
     # StatusPage section
     SECTION_STATUS_PAGE = "StatusPage"
@@ -63,6 +64,7 @@ class Config:
     DEFAULT_OUTPUT_PATH = "web"
     DEFAULT_PHP_PASSWORD = "changeme"
     DEFAULT_PHP_LOGIN_LIBRARY_PATH = ""
+    VALID_OUTPUT_TYPES = frozenset({"html", "php"})
 
     # FTP section
     SECTION_FTP = "FTP"
@@ -165,3 +167,4 @@ class Defaults:
     RELOAD_INTERVAL = 60  # seconds between database checks for hot-reload
     SHUTDOWN_WAIT_SECONDS = 30  # max wait for a running instance to stop
     SHUTDOWN_POLL_SECONDS = 0.5  # poll interval while waiting for stop
+    IDLE_POLL_SECONDS = 1  # main loop wait between shutdown-request checks
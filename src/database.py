@@ -129,37 +129,81 @@ class Database:
             )
             return cursor.lastrowid
 
-    def get_all_tasks(self) -> List[Dict]:
+    def _row_to_task(self, row: sqlite3.Row) -> Dict:
+        """Convert a tasks table row into a task dictionary."""
+        task = dict(row)
+        raw_args = task["arguments"]
+        task["arguments"] = json.loads(raw_args)
+
+        # Ensure backwards compatibility: default task_type to 'script' if None
+        if task.get("task_type") is None:
+            task["task_type"] = TaskTypes.SCRIPT
+
+        task["launch_new_process"] = bool(task.get("launch_new_process", 0))
+
+        # Log argument details if enabled
+        if self.logger.is_detailed_logging_enabled():
+            self.logger.debug(f"Raw JSON from database: {raw_args}")
+            self.logger.log_arguments(
+                task["arguments"], f"Loading Task {task['id']} Arguments"
+            )
+
+        return task
+
+    def get_all_tasks(self, name_filter: Optional[str] = None) -> List[Dict]:
         """
         Get all tasks from the database.
 
+        Args:
+            name_filter: Optional case-insensitive substring the task name must contain
+
         Returns:
             List of task dictionaries containing id, name, script_path, arguments, interval, task_type, command
         """
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM tasks")
-            tasks = []
-            for row in cursor:
-                task = dict(row)
-                raw_args = task["arguments"]
-                task["arguments"] = json.loads(raw_args)
-
-                # Ensure backwards compatibility: default task_type to 'script' if None
-                if task.get("task_type") is None:
-                    task["task_type"] = TaskTypes.SCRIPT
+            if not name_filter:
+                cursor = conn.execute("SELECT * FROM tasks")
+                return [self._row_to_task(row) for row in cursor]
+
+            # SQLite's LIKE only folds ASCII case, so non-ASCII filters
+            # are matched in Python to keep str.lower() semantics
+            if not name_filter.isascii():
+                filter_lower = name_filter.lower()
+                cursor = conn.execute("SELECT * FROM tasks")
+                return [
+                    self._row_to_task(row)
+                    for row in cursor
+                    if filter_lower in row["name"].lower()
+                ]
+
+            escaped = (
+                name_filter.replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
+            pattern = f"%{escaped}%"
+            cursor = conn.execute(
+                "SELECT * FROM tasks WHERE name LIKE ? ESCAPE '\\'", (pattern,)
+            )
+            return [self._row_to_task(row) for row in cursor]
 
-                task["launch_new_process"] = bool(task.get("launch_new_process", 0))
+    def get_task(self, task_id: int) -> Optional[Dict]:
+        """
+        Get a single task by its ID.
 
-                # Log argument details if enabled
-                if self.logger.is_detailed_logging_enabled():
-                    self.logger.debug(f"Raw JSON from database: {raw_args}")
-                    self.logger.log_arguments(
-                        task["arguments"], f"Loading Task {task['id']} Arguments"
-                    )
+        Args:
+            task_id: ID of the task
 
-                tasks.append(task)
-            return tasks
+        Returns:
+            Task dictionary, or None if no task has this ID
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            return self._row_to_task(row) if row else None
 
     def remove_task(self, task_id: int):
         """
@@ -265,6 +309,47 @@ class Database:
                 }
             return result
 
+    def get_last_execution(self, task_id: int) -> Optional[Dict]:
+        """
+        Get the most recent execution of a single task.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            Dict with execution_time and success, or None if the task never ran
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                """
+                SELECT execution_time, success
+                FROM task_history
+                WHERE task_id = ?
+                ORDER BY execution_time DESC
+                LIMIT 1
+            """,
+                (task_id,),
+            ).fetchone()
+
+            if row is None:
+                return None
+            return {
+                "execution_time": row["execution_time"],
+                "success": bool(row["success"]),
+            }
+
+    def get_last_execution_id(self) -> int:
+        """
+        Get the id of the newest execution record.
+
+        Returns:
+            The highest execution id, or 0 if there is no history
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("SELECT MAX(id) FROM task_history").fetchone()
+            return row[0] or 0
+
     def edit_task(
         self,
         task_id: int,
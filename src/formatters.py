@@ -1,4 +1,8 @@
-from typing import Dict, List
+import operator
+import re
+import shlex
+from datetime import datetime
+from typing import Dict, Iterator, List
 
 from .constants import Defaults, TaskTypes
 
@@ -66,6 +70,27 @@ def parse_interval(value: str) -> int:
     return amount * multiplier
 
 
+# Same times datetime.strptime(value, "%H:%M") accepts, e.g. "09:00" and "9:5"
+_START_TIME_RE = re.compile(r"(2[0-3]|[01]\d|\d):([0-5]\d|\d)")
+
+
+def is_valid_start_time(value: str) -> bool:
+    """Check whether a start time is a valid HH:MM clock time."""
+    return _START_TIME_RE.fullmatch(value) is not None
+
+
+# Quote and escape characters, plus the ASCII whitespace str.split() breaks
+# on but shlex does not; without these str.split() matches shlex.split().
+_SHLEX_SPECIAL = frozenset("'\"\\\x0b\x0c\x1c\x1d\x1e\x1f")
+
+
+def split_arguments(text: str) -> List[str]:
+    """Split an argument string like shlex.split, skipping the lexer for plain input."""
+    if text.isascii() and _SHLEX_SPECIAL.isdisjoint(text):
+        return text.split()
+    return shlex.split(text)
+
+
 def format_interval(interval: int) -> str:
     """Format an interval (in minutes) for human-readable display.
 
@@ -117,57 +142,70 @@ def format_execution_history(executions: List[Dict]) -> str:
     return "\n".join(output)
 
 
-def format_task_list(tasks: List[Dict], show_next_run: bool = True) -> str:
-    """Format task list for display."""
-    if not tasks:
-        return "No tasks scheduled."
+# Required task fields fetched in one call per task
+_get_task_fields = operator.itemgetter("id", "name", "script_path", "interval", "arguments")
 
-    output = []
-    for task in tasks:
-        task_type = task.get("task_type", TaskTypes.SCRIPT)
-
-        start_time = task.get("start_time")
-        interval = task["interval"]
-        interval_display = format_interval(interval)
-        if task_type == TaskTypes.UV_COMMAND:
-            lines = [
-                f"\n{task['id']}. {task['name']} [uv command]",
-                f"   Project: {task['script_path']}",
-                f"   Command: {task.get('command', 'N/A')}",
-                f"   Interval: {interval_display}",
-            ]
+
+def _format_next_run(next_run_time: datetime) -> str:
+    """Format a next run time as shown in task listings.
+
+    isoformat skips strftime's locale handling. The tz offset is dropped so
+    the output stays "YYYY-MM-DD HH:MM:SS".
+    """
+    return next_run_time.replace(tzinfo=None).isoformat(" ", "seconds")
+
+
+def _iter_task_lines(task: Dict, show_next_run: bool) -> Iterator[str]:
+    """Yield the display lines for a single task."""
+    task_id, name, script_path, interval, arguments = _get_task_fields(task)
+    task_type = task.get("task_type", TaskTypes.SCRIPT)
+
+    if task_type == TaskTypes.UV_COMMAND:
+        yield f"\n{task_id}. {name} [uv command]"
+        yield f"   Project: {script_path}"
+        yield f"   Command: {task.get('command', 'N/A')}"
+    else:
+        yield f"\n{task_id}. {name}"
+        yield f"   Script: {script_path}"
+    yield f"   Interval: {format_interval(interval)}"
+
+    start_time = task.get("start_time")
+    if start_time:
+        yield f"   Start time: {start_time}"
+
+    if task.get("launch_new_process"):
+        yield "   Launch mode: new console"
+
+    yield f"   Arguments: {' '.join(arguments) if arguments else 'None'}"
+
+    # Add last run info
+    last_run_time = task.get("last_run_time")
+    if last_run_time:
+        success_str = "success" if task.get("last_run_success") else "failed"
+        yield f"   Last run: {last_run_time} ({success_str})"
+    else:
+        yield "   Last run: Never"
+
+    if show_next_run:
+        if interval == 0:
+            next_run = Defaults.MANUAL_ONLY_LABEL
+        elif task["next_run_time"]:
+            next_run = _format_next_run(task["next_run_time"])
         else:
-            lines = [
-                f"\n{task['id']}. {task['name']}",
-                f"   Script: {task['script_path']}",
-                f"   Interval: {interval_display}",
-            ]
+            next_run = "Not scheduled"
+        yield f"   Next run: {next_run}"
 
-        if start_time:
-            lines.append(f"   Start time: {start_time}")
 
-        if task.get("launch_new_process"):
-            lines.append("   Launch mode: new console")
+def format_task(task: Dict, show_next_run: bool = True) -> str:
+    """Format a single task like a one-entry format_task_list."""
+    return "\n".join(_iter_task_lines(task, show_next_run))
 
-        lines.append(
-            f"   Arguments: {' '.join(task['arguments']) if task['arguments'] else 'None'}"
-        )
 
-        # Add last run info
-        last_run_time = task.get("last_run_time")
-        if last_run_time:
-            success_str = "success" if task.get("last_run_success") else "failed"
-            lines.append(f"   Last run: {last_run_time} ({success_str})")
-        else:
-            lines.append("   Last run: Never")
-
-        if show_next_run:
-            if interval == 0:
-                next_run = Defaults.MANUAL_ONLY_LABEL
-            elif task["next_run_time"]:
-                next_run = task["next_run_time"].strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                next_run = "Not scheduled"
-            lines.append(f"   Next run: {next_run}")
-        output.extend(lines)
-    return "\n".join(output)
+def format_task_list(tasks: List[Dict], show_next_run: bool = True) -> str:
+    """Format task list for display."""
+    if not tasks:
+        return "No tasks scheduled."
+
+    return "\n".join(
+        line for task in tasks for line in _iter_task_lines(task, show_next_run)
+    )
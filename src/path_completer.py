@@ -0,0 +1,89 @@
+import os
+from typing import Dict, Iterable, List, Tuple
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+
+class CachedPathCompleter(Completer):
+    """
+    Path completer that lists each directory once and filters in memory.
+
+    Directory listings are read with os.scandir and cached together with the
+    directory's mtime, so typing further characters only filters the cached
+    entries instead of re-reading the directory on every keystroke.
+    """
+
+    def __init__(self, expanduser: bool = True):
+        self.expanduser = expanduser
+        self._cache: Dict[str, Tuple[int, List[Tuple[str, bool]]]] = {}
+
+    def _list_dir(self, directory: str) -> List[Tuple[str, bool]]:
+        """
+        Return (name, is_dir) pairs for a directory, sorted by name.
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+        cached = self._cache.get(directory)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        entries = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                entries.append((entry.name, is_dir))
+        entries.sort(key=lambda e: e[0].lower())
+        self._cache[directory] = (mtime_ns, entries)
+        return entries
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        text = document.text_before_cursor
+        if self.expanduser:
+            text = os.path.expanduser(text)
+
+        directory, partial = os.path.split(text)
+        partial_lower = partial.lower()
+
+        try:
+            entries = self._list_dir(directory or ".")
+        except OSError:
+            return
+
+        for name, is_dir in entries:
+            if name.lower().startswith(partial_lower):
+                yield Completion(
+                    text=name,
+                    start_position=-len(partial),
+                    display=name + "/" if is_dir else name,
+                )
+
+
+class ThresholdCompleter(Completer):
+    """
+    Completer wrapper that stays quiet until the typed name is long enough.
+
+    While typing, completions are only requested from the wrapped completer
+    once the last path component has at least min_input_len characters.
+    An explicit Tab press always completes.
+    """
+
+    def __init__(self, completer: Completer, min_input_len: int = 3):
+        self.completer = completer
+        self.min_input_len = min_input_len
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        if not complete_event.completion_requested:
+            partial = os.path.basename(document.text_before_cursor)
+            if len(partial) < self.min_input_len:
+                return
+        yield from self.completer.get_completions(document, complete_event)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import os
 from datetime import datetime, time, timedelta
 from typing import TYPE_CHECKING, Dict, List, Optional
@@ -21,6 +22,11 @@ if TYPE_CHECKING:
 class TaskScheduler:
     """Manages scheduled tasks using APScheduler."""
 
+    # Task set version, bumped after every change so callers can cache views
+    # derived from the task list. next() on a shared count is thread-safe.
+    _versions = itertools.count(1)
+    _version = 0
+
     def __init__(self):
         """Initialize the task scheduler."""
         self.logger = Logger("TaskScheduler")
@@ -35,10 +41,15 @@ class TaskScheduler:
         self.status_page = StatusPage()
         self._task_checksums = {}  # Track task state for hot-reload change detection
 
-    def start(self):
-        """Start the scheduler and load tasks from database."""
+    def start(self) -> List[Dict]:
+        """Start the scheduler and load tasks from database.
+
+        Returns:
+            List of the loaded tasks with the same run info as list_tasks
+        """
         # Load all tasks from database
         tasks = self.db.get_all_tasks()
+        last_executions = self.db.get_last_execution_per_task()
         for task in tasks:
             self._schedule_task(
                 task["id"],
@@ -49,6 +60,7 @@ class TaskScheduler:
                 task.get("task_type", TaskTypes.SCRIPT),
                 task.get("command"),
                 task.get("start_time"),
+                last_executions=last_executions,
             )
             # Store initial checksum for hot-reload
             self._task_checksums[task["id"]] = self._get_task_checksum(task)
@@ -67,6 +79,16 @@ class TaskScheduler:
             f"Scheduler started with {len(tasks)} tasks (hot-reload every {Defaults.RELOAD_INTERVAL}s)"
         )
 
+        # Reuse the loaded tasks for the caller's listing instead of re-querying
+        scheduler_jobs = {job.id: job for job in self.scheduler.get_jobs()}
+        for task in tasks:
+            self._add_run_info(
+                task,
+                scheduler_jobs.get(self._get_job_id(task["id"])),
+                last_executions.get(task["id"]),
+            )
+        return tasks
+
     def shutdown(self, wait: bool = False):
         """Shutdown the scheduler.
 
@@ -77,6 +99,14 @@ class TaskScheduler:
         self.scheduler.shutdown(wait=wait)
         self.logger.info("Scheduler shutdown")
 
+    def get_version(self) -> int:
+        """Get a number that changes whenever tasks are added, edited or removed."""
+        return self._version
+
+    def _bump_version(self):
+        """Mark the task set as changed."""
+        self._version = next(self._versions)
+
     def _get_job_id(self, task_id: int) -> str:
         """Generate a unique job ID for a task.
 
@@ -133,6 +163,7 @@ class TaskScheduler:
                     self.logger.info(
                         f"Hot-reload: Added new task '{task['name']}' (ID: {task_id})"
                     )
+                    self._bump_version()
                 elif self._task_checksums.get(task_id) != checksum:
                     # Task changed - reschedule it
                     try:
@@ -153,6 +184,7 @@ class TaskScheduler:
                     self.logger.info(
                         f"Hot-reload: Updated task '{task['name']}' (ID: {task_id})"
                     )
+                    self._bump_version()
 
             # Check for removed tasks
             for task_id in scheduled_task_ids - db_task_ids:
@@ -162,6 +194,7 @@ class TaskScheduler:
                     pass  # Job may not exist
                 del self._task_checksums[task_id]
                 self.logger.info(f"Hot-reload: Removed task ID {task_id}")
+                self._bump_version()
 
         except Exception as e:
             self.logger.error(f"Error during hot-reload: {str(e)}")
@@ -274,6 +307,7 @@ class TaskScheduler:
         task_type: str = TaskTypes.SCRIPT,
         command: Optional[str] = None,
         start_time: Optional[str] = None,
+        last_executions: Optional[Dict[int, Dict]] = None,
     ):
         """
         Schedule a task in the APScheduler.
@@ -291,6 +325,8 @@ class TaskScheduler:
             task_type: Type of task ('script' or 'uv_command')
             command: Command name for uv_command tasks
             start_time: Optional start time for aligned scheduling (HH:MM format)
+            last_executions: Optional result of db.get_last_execution_per_task(),
+                passed in when scheduling many tasks at once
         """
         # Manual-only tasks (interval 0) don't get an APScheduler job
         if interval == 0:
@@ -303,7 +339,8 @@ class TaskScheduler:
         job_id = self._get_job_id(task_id)
 
         # Get last execution time to calculate proper next_run_time
-        last_executions = self.db.get_last_execution_per_task()
+        if last_executions is None:
+            last_executions = self.db.get_last_execution_per_task()
 
         if start_time:
             # Use aligned scheduling based on start_time
@@ -382,6 +419,8 @@ class TaskScheduler:
                 launch_new_process=launch_new_process,
             )
 
+            self._bump_version()
+
             # Schedule the task with the ID
             self._schedule_task(
                 task_id,
@@ -422,12 +461,12 @@ class TaskScheduler:
         """
         try:
             # Get task details before removal
-            tasks = self.db.get_all_tasks()
-            task = next((t for t in tasks if t["id"] == task_id), None)
+            task = self.db.get_task(task_id)
 
             if task:
                 # Remove from database first
                 self.db.remove_task(task_id)
+                self._bump_version()
 
                 # Only try to remove from scheduler if it's running
                 if self.scheduler.running:
@@ -498,6 +537,7 @@ class TaskScheduler:
                 launch_new_process=launch_new_process,
             ):
                 raise ValueError(f"Task with ID {task_id} not found")
+            self._bump_version()
 
             # Update in scheduler if running
             if self.scheduler.running:
@@ -532,34 +572,64 @@ class TaskScheduler:
             self.logger.error(f"Error updating task {task_id}: {str(e)}")
             raise
 
-    def list_tasks(self) -> List[Dict]:
+    def _add_run_info(
+        self, task: Dict, job, last_execution: Optional[Dict]
+    ) -> Dict:
+        """Attach next run time and last execution info to a task dictionary."""
+        task["next_run_time"] = job.next_run_time if job else None
+
+        if last_execution:
+            task["last_run_time"] = last_execution["execution_time"]
+            task["last_run_success"] = last_execution["success"]
+        else:
+            task["last_run_time"] = None
+            task["last_run_success"] = None
+
+        return task
+
+    def list_tasks(self, name_filter: Optional[str] = None) -> List[Dict]:
         """
         Get a list of all tasks with their next run times and last execution info.
 
+        Args:
+            name_filter: Optional case-insensitive substring the task name must contain
+
         Returns:
             List of task dictionaries with additional scheduler information
         """
-        tasks = self.db.get_all_tasks()
+        tasks = self.db.get_all_tasks(name_filter)
         scheduler_jobs = {job.id: job for job in self.scheduler.get_jobs()}
         last_executions = self.db.get_last_execution_per_task()
 
         for task in tasks:
-            job_id = self._get_job_id(task["id"])
-            if job_id in scheduler_jobs:
-                task["next_run_time"] = scheduler_jobs[job_id].next_run_time
-            else:
-                task["next_run_time"] = None
-
-            # Add last execution info
-            if task["id"] in last_executions:
-                task["last_run_time"] = last_executions[task["id"]]["execution_time"]
-                task["last_run_success"] = last_executions[task["id"]]["success"]
-            else:
-                task["last_run_time"] = None
-                task["last_run_success"] = None
+            self._add_run_info(
+                task,
+                scheduler_jobs.get(self._get_job_id(task["id"])),
+                last_executions.get(task["id"]),
+            )
 
         return tasks
 
+    def get_task(self, task_id: int) -> Optional[Dict]:
+        """
+        Get a single task with its next run time and last execution info.
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            Task dictionary like the ones from list_tasks, or None if not found
+        """
+        task = self.db.get_task(task_id)
+        if task is None:
+            return None
+
+        return self._add_run_info(
+            task,
+            self.scheduler.get_job(self._get_job_id(task_id)),
+            self.db.get_last_execution(task_id),
+        )
+
     def run_task(
         self,
         task_id: int,
@@ -582,8 +652,7 @@ class TaskScheduler:
         """
         try:
             # Get task details from the database
-            tasks = self.db.get_all_tasks()
-            task = next((t for t in tasks if t["id"] == task_id), None)
+            task = self.db.get_task(task_id)
 
             if not task:
                 self.logger.error(f"Task with ID {task_id} not found")
@@ -5,7 +5,7 @@ import shlex
 import subprocess
 import threading
 import tomllib
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from .constants import Discovery, Interactive, Paths
 from .logger import Logger
@@ -23,6 +23,23 @@ class ScriptRunner:
     def __init__(self):
         """Initialize ScriptRunner with logger."""
         self.logger = Logger("ScriptRunner")
+        # pyproject.toml path -> (st_mtime_ns, parsed data)
+        self._pyproject_cache: Dict[str, Tuple[int, dict]] = {}
+
+    def _read_pyproject(self, pyproject_path: str) -> dict:
+        """Parse a pyproject.toml, reusing the last result while its mtime is unchanged.
+
+        Raises OSError or tomllib.TOMLDecodeError like reading the file directly.
+        """
+        mtime_ns = os.stat(pyproject_path).st_mtime_ns
+        cached = self._pyproject_cache.get(pyproject_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        with open(pyproject_path, "rb") as f:
+            data = tomllib.load(f)
+        self._pyproject_cache[pyproject_path] = (mtime_ns, data)
+        return data
 
     def _is_uv_project(self, script_dir: str) -> bool:
         """Check if the script directory is a uv-managed project."""
@@ -414,13 +431,11 @@ class ScriptRunner:
         """
         pyproject_path = os.path.join(project_dir, Paths.PYPROJECT_TOML)
 
-        if not os.path.exists(pyproject_path):
-            return []
-
         try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
+            data = self._read_pyproject(pyproject_path)
             return list(data.get("project", {}).get("scripts", {}).keys())
+        except FileNotFoundError:
+            return []
         except Exception as e:
             self.logger.error(f"Error reading pyproject.toml: {str(e)}")
             return []
@@ -444,8 +459,7 @@ class ScriptRunner:
         pyproject_path = os.path.join(project_dir, Paths.PYPROJECT_TOML)
         if os.path.exists(pyproject_path):
             try:
-                with open(pyproject_path, "rb") as f:
-                    pyproject_data = tomllib.load(f)
+                pyproject_data = self._read_pyproject(pyproject_path)
             except Exception:
                 pyproject_data = {}
 
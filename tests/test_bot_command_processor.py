@@ -2,7 +2,7 @@
 
 import time
 import threading
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from bot_commander import BotMessage
@@ -95,8 +95,7 @@ def config() -> BotConfig:
 @pytest.fixture()
 def processor(scheduler_mock: MagicMock, config: BotConfig) -> TaskCommandProcessor:
     """Create a TaskCommandProcessor with mocked dependencies."""
-    with patch("src.bot.command_processor.Logger"):
-        return TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+    return TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
 
 
 # -- Help command tests --
@@ -148,38 +147,46 @@ class TestListCommand:
     def test_list_with_filter(
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
-        tasks = [
-            _make_task(task_id=1, name="Backup"),
-            _make_task(task_id=2, name="Cleanup"),
-        ]
-        scheduler_mock.list_tasks.return_value = tasks
+        scheduler_mock.list_tasks.return_value = [_make_task(task_id=1, name="Backup")]
         msg = BotMessage(user_id="user1", text="/list backup")
         response = processor.handle(msg)
+        scheduler_mock.list_tasks.assert_called_once_with(name_filter="backup")
         assert "Backup" in response.text
-        assert "Cleanup" not in response.text
 
     def test_list_filter_case_insensitive(
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
-        tasks = [
-            _make_task(task_id=1, name="Backup"),
-            _make_task(task_id=2, name="Cleanup"),
-        ]
-        scheduler_mock.list_tasks.return_value = tasks
+        scheduler_mock.list_tasks.return_value = [_make_task(task_id=1, name="Backup")]
         msg = BotMessage(user_id="user1", text="/list BACKUP")
-        response = processor.handle(msg)
-        assert "Backup" in response.text
-        assert "Cleanup" not in response.text
+        processor.handle(msg)
+        scheduler_mock.list_tasks.assert_called_once_with(name_filter="backup")
+
+    def test_list_without_filter_lists_all(
+        self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
+    ) -> None:
+        scheduler_mock.list_tasks.return_value = []
+        processor.handle(BotMessage(user_id="user1", text="/list"))
+        scheduler_mock.list_tasks.assert_called_once_with(name_filter=None)
 
     def test_list_filter_no_match_returns_no_tasks(
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
-        tasks = [_make_task(task_id=1, name="Backup")]
-        scheduler_mock.list_tasks.return_value = tasks
+        scheduler_mock.list_tasks.return_value = []
         msg = BotMessage(user_id="user1", text="/list nonexistent")
         response = processor.handle(msg)
         assert response.text == Messages.NO_TASKS
 
+    def test_list_queries_tasks_every_time(
+        self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
+    ) -> None:
+        """Edits made outside the bot process show up on the next /list."""
+        scheduler_mock.list_tasks.return_value = [_make_task(task_id=1, name="Backup")]
+        processor.handle(BotMessage(user_id="user1", text="/list"))
+
+        scheduler_mock.list_tasks.return_value = [_make_task(task_id=1, name="Renamed")]
+        response = processor.handle(BotMessage(user_id="user1", text="/list"))
+        assert "Renamed" in response.text
+
 
 # -- Run command tests --
 
@@ -192,7 +199,7 @@ class TestRunCommand:
     ) -> None:
         """Run command returns immediate 'Running task...' acknowledgment."""
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         # Block run_task so the thread doesn't finish before we assert
         scheduler_mock.run_task.side_effect = lambda *a, **kw: time.sleep(0.5)
         msg = BotMessage(user_id="user1", text="/run 1")
@@ -204,7 +211,7 @@ class TestRunCommand:
     ) -> None:
         """Run command spawns a daemon thread for task execution."""
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         done = threading.Event()
         scheduler_mock.run_task.side_effect = lambda *a, **kw: done.set() or True
         processor.handle(BotMessage(user_id="user1", text="/run 1"))
@@ -217,7 +224,7 @@ class TestRunCommand:
         notifier = MagicMock()
         processor.set_notifier(notifier)
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.run_task.return_value = True
         processor.handle(BotMessage(user_id="user1", text="/run 1"))
         # Wait for thread to complete
@@ -233,7 +240,7 @@ class TestRunCommand:
         notifier = MagicMock()
         processor.set_notifier(notifier)
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.run_task.return_value = False
         processor.handle(BotMessage(user_id="user1", text="/run 1"))
         time.sleep(0.5)
@@ -248,7 +255,7 @@ class TestRunCommand:
         notifier = MagicMock()
         processor.set_notifier(notifier)
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.run_task.side_effect = RuntimeError("Connection lost")
         processor.handle(BotMessage(user_id="user1", text="/run 1"))
         time.sleep(0.5)
@@ -261,7 +268,7 @@ class TestRunCommand:
     ) -> None:
         """Without a notifier set, async execution completes without crash."""
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.run_task.return_value = True
         processor.handle(BotMessage(user_id="user1", text="/run 1"))
         time.sleep(0.5)
@@ -281,7 +288,7 @@ class TestRunCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         """When task not in list, uses fallback name but still spawns thread."""
-        scheduler_mock.list_tasks.return_value = []
+        scheduler_mock.get_task.return_value = None
         scheduler_mock.run_task.side_effect = ValueError("Task with ID 99 not found")
         notifier = MagicMock()
         processor.set_notifier(notifier)
@@ -301,7 +308,7 @@ class TestRunCommand:
         notifier = MagicMock()
         processor.set_notifier(notifier)
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.run_task.return_value = True
         processor.handle(BotMessage(user_id="user1", text="/run 1"))
         time.sleep(0.5)
@@ -469,7 +476,7 @@ class TestEditCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         msg = BotMessage(user_id="user1", text="/edit 1")
         response = processor.handle(msg)
         assert "Backup" in response.text
@@ -488,7 +495,7 @@ class TestEditCommand:
     def test_edit_nonexistent_task(
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
-        scheduler_mock.list_tasks.return_value = []
+        scheduler_mock.get_task.return_value = None
         msg = BotMessage(user_id="user1", text="/edit 99")
         response = processor.handle(msg)
         assert response.text == Messages.TASK_NOT_FOUND.format(99)
@@ -500,7 +507,7 @@ class TestEditCommand:
         task = _make_task(
             task_id=1, name="Backup", script_path="backup.py", interval=60
         )
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
 
         # Start edit
         processor.handle(BotMessage(user_id="user1", text="/edit 1"))
@@ -525,7 +532,7 @@ class TestEditCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
 
         processor.handle(BotMessage(user_id="user1", text="/edit 1"))
         response = processor.handle(BotMessage(user_id="user1", text="/cancel"))
@@ -539,7 +546,7 @@ class TestEditCommand:
         task = _make_task(
             task_id=1, name="Backup", script_path="backup.py", interval=60
         )
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.edit_task.side_effect = RuntimeError("DB error")
 
         processor.handle(BotMessage(user_id="user1", text="/edit 1"))
@@ -562,7 +569,7 @@ class TestDeleteCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         msg = BotMessage(user_id="user1", text="/delete 1")
         response = processor.handle(msg)
         assert "Backup" in response.text
@@ -572,7 +579,7 @@ class TestDeleteCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
 
         processor.handle(BotMessage(user_id="user1", text="/delete 1"))
         response = processor.handle(BotMessage(user_id="user1", text="yes"))
@@ -583,7 +590,7 @@ class TestDeleteCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
 
         processor.handle(BotMessage(user_id="user1", text="/delete 1"))
         response = processor.handle(BotMessage(user_id="user1", text="no"))
@@ -603,7 +610,7 @@ class TestDeleteCommand:
     def test_delete_nonexistent_task(
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
-        scheduler_mock.list_tasks.return_value = []
+        scheduler_mock.get_task.return_value = None
         msg = BotMessage(user_id="user1", text="/delete 99")
         response = processor.handle(msg)
         assert response.text == Messages.TASK_NOT_FOUND.format(99)
@@ -612,7 +619,7 @@ class TestDeleteCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
 
         processor.handle(BotMessage(user_id="user1", text="/delete 1"))
         response = processor.handle(BotMessage(user_id="user1", text="/cancel"))
@@ -623,7 +630,7 @@ class TestDeleteCommand:
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.remove_task.side_effect = RuntimeError("DB error")
 
         processor.handle(BotMessage(user_id="user1", text="/delete 1"))
@@ -687,24 +694,21 @@ class TestDisabledCommands:
 
     def test_add_disabled(self, scheduler_mock: MagicMock) -> None:
         config = _make_config(allow_add=False)
-        with patch("src.bot.command_processor.Logger"):
-            proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+        proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
         msg = BotMessage(user_id="user1", text="/add")
         response = proc.handle(msg)
         assert response.text == Messages.COMMAND_DISABLED.format(Commands.ADD)
 
     def test_edit_disabled(self, scheduler_mock: MagicMock) -> None:
         config = _make_config(allow_edit=False)
-        with patch("src.bot.command_processor.Logger"):
-            proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+        proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
         msg = BotMessage(user_id="user1", text="/edit 1")
         response = proc.handle(msg)
         assert response.text == Messages.COMMAND_DISABLED.format(Commands.EDIT)
 
     def test_delete_disabled(self, scheduler_mock: MagicMock) -> None:
         config = _make_config(allow_delete=False)
-        with patch("src.bot.command_processor.Logger"):
-            proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+        proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
         msg = BotMessage(user_id="user1", text="/delete 1")
         response = proc.handle(msg)
         assert response.text == Messages.COMMAND_DISABLED.format(Commands.DELETE)
@@ -712,26 +716,23 @@ class TestDisabledCommands:
     def test_list_always_allowed(self, scheduler_mock: MagicMock) -> None:
         config = _make_config(allow_add=False, allow_edit=False, allow_delete=False)
         scheduler_mock.list_tasks.return_value = []
-        with patch("src.bot.command_processor.Logger"):
-            proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+        proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
         msg = BotMessage(user_id="user1", text="/list")
         response = proc.handle(msg)
         assert response.text == Messages.NO_TASKS
 
     def test_help_always_allowed(self, scheduler_mock: MagicMock) -> None:
         config = _make_config(allow_add=False, allow_edit=False, allow_delete=False)
-        with patch("src.bot.command_processor.Logger"):
-            proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+        proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
         msg = BotMessage(user_id="user1", text="/help")
         response = proc.handle(msg)
         assert response.text == Messages.HELP
 
     def test_run_always_allowed(self, scheduler_mock: MagicMock) -> None:
         config = _make_config(allow_add=False, allow_edit=False, allow_delete=False)
-        scheduler_mock.list_tasks.return_value = [_make_task(task_id=1, name="Backup")]
+        scheduler_mock.get_task.return_value = _make_task(task_id=1, name="Backup")
         scheduler_mock.run_task.return_value = True
-        with patch("src.bot.command_processor.Logger"):
-            proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+        proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
         msg = BotMessage(user_id="user1", text="/run 1")
         response = proc.handle(msg)
         assert response.text == Messages.TASK_RUNNING.format("Backup", 1)
@@ -739,8 +740,7 @@ class TestDisabledCommands:
     def test_history_always_allowed(self, scheduler_mock: MagicMock) -> None:
         config = _make_config(allow_add=False, allow_edit=False, allow_delete=False)
         scheduler_mock.db.get_recent_executions.return_value = []
-        with patch("src.bot.command_processor.Logger"):
-            proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
+        proc = TaskCommandProcessor(scheduler=scheduler_mock, bot_config=config)
         msg = BotMessage(user_id="user1", text="/history")
         response = proc.handle(msg)
         assert response.text == Messages.NO_HISTORY
@@ -907,12 +907,23 @@ class TestCommandAliases:
     ) -> None:
         """Short alias 'r 1' triggers run command with arguments."""
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         scheduler_mock.run_task.return_value = True
         msg = BotMessage(user_id="user1", text="r 1")
         response = processor.handle(msg)
         assert response.text == Messages.TASK_RUNNING.format("Backup", 1)
 
+    def test_run_args_after_tab_or_newline(
+        self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
+    ) -> None:
+        """Any whitespace separates the command word from its arguments."""
+        task = _make_task(task_id=5, name="Backup")
+        scheduler_mock.get_task.return_value = task
+        scheduler_mock.run_task.return_value = True
+        for text in ("/run\t5", "run\n5", "r \t 5"):
+            response = processor.handle(BotMessage(user_id="user1", text=text))
+            assert response.text == Messages.TASK_RUNNING.format("Backup", 5), text
+
     def test_add_alias_a(
         self, processor: TaskCommandProcessor, scheduler_mock: MagicMock
     ) -> None:
@@ -926,7 +937,7 @@ class TestCommandAliases:
     ) -> None:
         """Short alias 'e 1' triggers edit wizard."""
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         msg = BotMessage(user_id="user1", text="e 1")
         response = processor.handle(msg)
         assert "Backup" in response.text
@@ -936,7 +947,7 @@ class TestCommandAliases:
     ) -> None:
         """Short alias 'd 1' triggers delete confirmation."""
         task = _make_task(task_id=1, name="Backup")
-        scheduler_mock.list_tasks.return_value = [task]
+        scheduler_mock.get_task.return_value = task
         msg = BotMessage(user_id="user1", text="d 1")
         response = processor.handle(msg)
         assert "Backup" in response.text
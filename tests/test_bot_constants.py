@@ -44,6 +44,18 @@ class TestCommands:
         for cmd in command_values:
             assert cmd.startswith("/"), f"Command {cmd} does not start with /"
 
+    def test_names_resolve_commands_and_aliases(self) -> None:
+        assert Commands.NAMES["list"] == "list"
+        assert Commands.NAMES["l"] == "list"
+        assert Commands.NAMES["exit"] == "cancel"
+        for alias, name in Commands.ALIASES.items():
+            assert Commands.NAMES[alias] == name
+
+    def test_names_accept_slash_prefix(self) -> None:
+        assert Commands.NAMES["/list"] == "list"
+        assert Commands.NAMES["/l"] == "list"
+        assert Commands.NAMES["/exit"] == "cancel"
+
 
 class TestMessages:
     """Tests for Messages constants."""
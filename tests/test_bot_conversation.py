@@ -79,6 +79,12 @@ class TestAddWizardStart:
         _, response = AddWizard.start()
         assert response.text == Messages.WIZARD_ADD_START
 
+    def test_start_reuses_prompt_response(self) -> None:
+        first_state, first = AddWizard.start()
+        second_state, second = AddWizard.start()
+        assert first is second
+        assert first_state is not second_state
+
 
 class TestAddWizardScriptFlow:
     """Tests for AddWizard full flow with a script task."""
@@ -395,6 +401,13 @@ class TestAddWizardEdgeCases:
         assert state is not None
         assert state.data["script_path"] == "backup.py"
 
+    def test_out_of_range_step_cancels(self) -> None:
+        for step in (-1, 8):
+            state = ConversationState(kind="add_wizard", step=step)
+            new_state, response = AddWizard.advance(state, "yes")
+            assert new_state is None
+            assert response.text == Messages.OPERATION_CANCELLED
+
 
 class TestEditWizardStart:
     """Tests for EditWizard.start()."""
@@ -430,6 +443,18 @@ class TestEditWizardStart:
         _, response = EditWizard.start(task)
         assert str(task["id"]) in response.text
 
+    def test_start_stores_arguments_display(self) -> None:
+        task = _make_sample_task()
+        task["arguments"] = ["--verbose", "--dry-run"]
+        state, _ = EditWizard.start(task)
+        assert state.data["args_display"] == "--verbose --dry-run"
+
+    def test_start_arguments_display_empty_without_arguments(self) -> None:
+        task = _make_sample_task()
+        task["arguments"] = None
+        state, _ = EditWizard.start(task)
+        assert state.data["args_display"] == ""
+
 
 class TestEditWizardScriptFlow:
     """Tests for EditWizard full flow with a script task."""
@@ -688,6 +713,17 @@ class TestEditWizardEdgeCases:
         assert state is not None
         assert state.data["changes"]["script_path"] == "new_script.py"
 
+    def test_step3_zero_interval_shows_current_launch_mode(self) -> None:
+        for current, shown in ((True, "yes"), (False, "no")):
+            state = _build_edit_state_at_step3()
+            state.data["original"]["launch_new_process"] = current
+            new_state, response = EditWizard.advance(state, "0")
+            assert new_state is not None
+            assert new_state.step == 5
+            assert response.text == Messages.WIZARD_EDIT_LAUNCH_NEW_PROCESS.format(
+                shown
+            )
+
     def test_step3_interval_minimum_1(self) -> None:
         state = _build_edit_state_at_step3()
         new_state, _ = EditWizard.advance(state, "1")
@@ -706,6 +742,17 @@ class TestEditWizardEdgeCases:
         new_state, _ = EditWizard.advance(state, "Yes")
         assert new_state is None
 
+    def test_out_of_range_step_cancels(self) -> None:
+        for step in (-1, 8):
+            state = ConversationState(
+                kind="edit_wizard",
+                step=step,
+                data={"original": _make_sample_task(), "changes": {}},
+            )
+            new_state, response = EditWizard.advance(state, "yes")
+            assert new_state is None
+            assert response.text == Messages.OPERATION_CANCELLED
+
 
 class TestDeleteConfirmationStart:
     """Tests for DeleteConfirmation.start()."""
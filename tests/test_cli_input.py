@@ -0,0 +1,74 @@
+"""Tests for prompts on the shared PromptSession in src.cli_input."""
+
+from unittest.mock import MagicMock, patch
+
+from prompt_toolkit import PromptSession
+from prompt_toolkit.completion import DummyCompleter
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from src.cli_input import (
+    _get_arguments,
+    _get_path_completer,
+    _get_path_key_bindings,
+    _get_plain_key_bindings,
+    _prompt_line,
+)
+
+
+class TestPromptLine:
+    """Tests for _prompt_line."""
+
+    def test_resets_settings_left_by_earlier_prompt(self):
+        """Path completion and multiline mode do not carry over."""
+        with create_pipe_input() as pipe_input:
+            session = PromptSession(input=pipe_input, output=DummyOutput())
+            pipe_input.send_text("some/path\r")
+            session.prompt(
+                "Path: ",
+                completer=_get_path_completer(),
+                key_bindings=_get_path_key_bindings(),
+                multiline=True,
+            )
+
+            pipe_input.send_text("My Task\r")
+            answer = _prompt_line(session, "Task name: ")
+
+        assert answer == "My Task"
+        assert isinstance(session.completer, DummyCompleter)
+        assert session.key_bindings is _get_plain_key_bindings()
+        assert session.multiline is False
+
+
+class TestGetArguments:
+    """Tests for the multi-line arguments prompt on the shared session."""
+
+    def test_does_not_keep_path_completer(self):
+        with create_pipe_input() as pipe_input:
+            session = PromptSession(input=pipe_input, output=DummyOutput())
+            pipe_input.send_text("some/path\r")
+            session.prompt(
+                "Path: ",
+                completer=_get_path_completer(),
+                key_bindings=_get_path_key_bindings(),
+            )
+
+            pipe_input.send_text('--name "a b"\r\r')
+            with patch("sys.stdin") as mock_stdin:
+                mock_stdin.isatty.return_value = True
+                arguments = _get_arguments(session, None)
+
+        assert arguments == ["--name", "a b"]
+        assert isinstance(session.completer, DummyCompleter)
+
+    def test_piped_input_stops_at_blank_line(self):
+        """The add flow reads piped arguments like set-arguments does."""
+        session = MagicMock(spec=PromptSession)
+
+        with patch("sys.stdin") as mock_stdin:
+            mock_stdin.isatty.return_value = False
+            mock_stdin.readline.side_effect = ["--a 1\n", "--b 2\n", "\n", "x\n", ""]
+            arguments = _get_arguments(session, None)
+
+        assert arguments == ["--a", "1", "--b", "2"]
+        session.prompt.assert_not_called()
@@ -3,6 +3,7 @@
 import os
 import tempfile
 import configparser
+from unittest.mock import patch
 import pytest
 
 # We need to reset the singleton for each test
@@ -154,3 +155,83 @@ class TestConfigPersistence:
 
         # Restore original path
         config.config_path = original_path
+
+    def test_unchanged_value_does_not_rewrite_file(self, temp_config_dir):
+        config = config_module.Config()
+        original_path = config.config_path
+        config.config_path = os.path.join(temp_config_dir, "config.ini")
+        config.config = configparser.ConfigParser()
+        config._create_default_config()
+
+        with patch.object(
+            config, "_save_config", wraps=config._save_config
+        ) as save_config:
+            config.set_logging_level(config.get_logging_level())
+            config.set_ftp_settings({"host": config.get_ftp_settings()["host"]})
+            save_config.assert_not_called()
+
+            config.set_ftp_settings({"host": "ftp.example.com", "port": 2121})
+            save_config.assert_called_once()
+
+        assert config.get_ftp_settings()["port"] == 2121
+
+        config.config_path = original_path
+
+
+class TestConfigBotSettingsCache:
+    """Tests for the cached bot section."""
+
+    def test_replacing_parser_drops_cached_bot_settings(self, temp_config_dir):
+        config = config_module.Config()
+        config.config_path = os.path.join(temp_config_dir, "config.ini")
+        config.config = configparser.ConfigParser()
+        config._create_default_config()
+        assert config.get_bot_type() == "none"
+
+        parser = configparser.ConfigParser()
+        parser.read_dict({"Bot": {"type": "telegram", "bot_token": "abc"}})
+        config.config = parser
+
+        assert config.get_bot_type() == "telegram"
+        assert config.get_bot_setting("bot_token") == "abc"
+
+    def test_missing_bot_section_uses_fallbacks(self, temp_config_dir):
+        config = config_module.Config()
+        config.config_path = os.path.join(temp_config_dir, "config.ini")
+        config.config = configparser.ConfigParser()
+
+        assert config.get_bot_type() == "none"
+        assert config.get_bot_setting("jid", fallback="x") == "x"
+
+
+class TestConfigFtpSettingsCache:
+    """Tests for the cached FTP settings."""
+
+    def test_settings_parsed_once_and_copied(self, temp_config_dir):
+        config = config_module.Config()
+        config.config_path = os.path.join(temp_config_dir, "config.ini")
+        config.config = configparser.ConfigParser()
+        config._create_default_config()
+
+        with patch.object(
+            config, "_read_ftp_settings", wraps=config._read_ftp_settings
+        ) as read_settings:
+            first = config.get_ftp_settings()
+            first["host"] = "changed"
+            second = config.get_ftp_settings()
+
+        read_settings.assert_called_once()
+        assert second["host"] != "changed"
+
+    def test_setter_refreshes_cached_settings(self, temp_config_dir):
+        config = config_module.Config()
+        config.config_path = os.path.join(temp_config_dir, "config.ini")
+        config.config = configparser.ConfigParser()
+        config._create_default_config()
+        assert config.get_ftp_settings()["enabled"] is False
+
+        config.set_ftp_settings({"enabled": True, "timeout": 45})
+
+        settings = config.get_ftp_settings()
+        assert settings["enabled"] is True
+        assert settings["timeout"] == 45
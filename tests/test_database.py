@@ -52,6 +52,29 @@ class TestDatabaseGetTasks:
         assert tasks[0]["name"] == "Task 1"
         assert tasks[1]["name"] == "Task 2"
 
+    def test_get_all_tasks_name_filter_is_case_insensitive(self, temp_db):
+        temp_db.add_task("Nightly Backup", "/path/1.py", 5)
+        temp_db.add_task("Cleanup", "/path/2.py", 10)
+
+        tasks = temp_db.get_all_tasks("BACKUP")
+        assert [t["name"] for t in tasks] == ["Nightly Backup"]
+
+    def test_get_all_tasks_name_filter_escapes_wildcards(self, temp_db):
+        temp_db.add_task("100% done", "/path/1.py", 5)
+        temp_db.add_task("1000 items", "/path/2.py", 10)
+        temp_db.add_task("a_b", "/path/3.py", 10)
+        temp_db.add_task("axb", "/path/4.py", 10)
+
+        assert [t["name"] for t in temp_db.get_all_tasks("0%")] == ["100% done"]
+        assert [t["name"] for t in temp_db.get_all_tasks("a_")] == ["a_b"]
+
+    def test_get_all_tasks_name_filter_non_ascii(self, temp_db):
+        temp_db.add_task("Ärzte Sync", "/path/1.py", 5)
+        temp_db.add_task("Other", "/path/2.py", 10)
+
+        tasks = temp_db.get_all_tasks("ärzte")
+        assert [t["name"] for t in tasks] == ["Ärzte Sync"]
+
     def test_get_task_preserves_arguments(self, temp_db):
         args = ["--verbose", "--debug"]
         temp_db.add_task("Test", "/path/script.py", 5, args)
@@ -60,6 +83,24 @@ class TestDatabaseGetTasks:
         assert tasks[0]["arguments"] == args
 
 
+class TestDatabaseGetTask:
+    """Tests for get_task method."""
+
+    def test_get_task_by_id(self, temp_db):
+        temp_db.add_task("Task 1", "/path/1.py", 5)
+        task_id = temp_db.add_task("Task 2", "/path/2.py", 10, ["--flag"])
+
+        task = temp_db.get_task(task_id)
+        assert task["id"] == task_id
+        assert task["name"] == "Task 2"
+        assert task["arguments"] == ["--flag"]
+        assert task["task_type"] == TaskTypes.SCRIPT
+        assert task["launch_new_process"] is False
+
+    def test_get_task_not_found(self, temp_db):
+        assert temp_db.get_task(999) is None
+
+
 class TestDatabaseRemoveTask:
     """Tests for remove_task method."""
 
@@ -127,6 +168,25 @@ class TestDatabaseExecutionHistory:
         assert executions[0]["script_path"] == "/path/script.py"
 
 
+    def test_get_last_execution(self, temp_db):
+        task_id = temp_db.add_task("Test", "/path/script.py", 5)
+        assert temp_db.get_last_execution(task_id) is None
+
+        temp_db.add_task_execution(task_id, False)
+        last = temp_db.get_last_execution(task_id)
+        assert last["success"] is False
+        assert last["execution_time"]
+
+    def test_get_last_execution_id(self, temp_db):
+        assert temp_db.get_last_execution_id() == 0
+
+        task_id = temp_db.add_task("Test", "/path/script.py", 5)
+        temp_db.add_task_execution(task_id, True)
+        first = temp_db.get_last_execution_id()
+        temp_db.add_task_execution(task_id, False)
+        assert temp_db.get_last_execution_id() > first > 0
+
+
 class TestDatabaseClearAll:
     """Tests for clear_all_tasks method."""
 
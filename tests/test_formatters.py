@@ -1,9 +1,19 @@
 """Tests for src.formatters helper functions."""
 
+import shlex
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from src.constants import Defaults
-from src.formatters import format_interval, parse_interval
+from src.formatters import (
+    format_interval,
+    format_task,
+    format_task_list,
+    is_valid_start_time,
+    parse_interval,
+    split_arguments,
+)
 
 
 class TestParseInterval:
@@ -117,3 +127,104 @@ class TestFormatInterval:
 
     def test_one_day_one_hour(self):
         assert format_interval(1500) == "1500 minute(s) (1 day, 1 hour)"
+
+
+class TestFormatTaskListNextRun:
+    """Tests for the next run column of format_task_list()."""
+
+    def test_next_run_formatted_without_offset_or_microseconds(self):
+        next_run = datetime(
+            2024, 3, 5, 9, 7, 3, 123456, tzinfo=timezone(timedelta(hours=1))
+        )
+        task = {
+            "id": 1,
+            "name": "Task",
+            "script_path": "/path/script.py",
+            "interval": 5,
+            "arguments": [],
+            "next_run_time": next_run,
+        }
+
+        output = format_task_list([task], show_next_run=True)
+
+        assert "   Next run: 2024-03-05 09:07:03" in output.splitlines()
+
+    def test_same_instant_in_other_timezone_uses_its_own_clock(self):
+        utc_run = datetime(2024, 3, 5, 8, 0, tzinfo=timezone.utc)
+        local_run = utc_run.astimezone(timezone(timedelta(hours=2)))
+        task = {
+            "id": 1,
+            "name": "Task",
+            "script_path": "/path/script.py",
+            "interval": 5,
+            "arguments": [],
+        }
+
+        utc_output = format_task_list([{**task, "next_run_time": utc_run}])
+        local_output = format_task_list([{**task, "next_run_time": local_run}])
+
+        assert "   Next run: 2024-03-05 08:00:00" in utc_output.splitlines()
+        assert "   Next run: 2024-03-05 10:00:00" in local_output.splitlines()
+
+
+class TestIsValidStartTime:
+    """Tests for is_valid_start_time."""
+
+    @pytest.mark.parametrize("value", ["09:00", "9:05", "9:5", "00:00", "23:59"])
+    def test_valid_times(self, value):
+        assert is_valid_start_time(value) is True
+
+    @pytest.mark.parametrize(
+        "value", ["24:00", "12:60", "9am", "", "09:00:00", " 09:00", "0900"]
+    )
+    def test_invalid_times(self, value):
+        assert is_valid_start_time(value) is False
+
+    @pytest.mark.parametrize("value", ["09:00", "9:5", "24:00", "12:60", "9am"])
+    def test_matches_strptime(self, value):
+        try:
+            datetime.strptime(value, "%H:%M")
+            expected = True
+        except ValueError:
+            expected = False
+
+        assert is_valid_start_time(value) is expected
+
+
+class TestFormatTask:
+    """Tests for format_task."""
+
+    def test_matches_single_entry_task_list(self):
+        task = {
+            "id": 3,
+            "name": "Backup",
+            "script_path": "backup.py",
+            "interval": 0,
+            "arguments": ["--all"],
+            "start_time": None,
+            "last_run_time": None,
+            "next_run_time": None,
+        }
+
+        for show_next_run in (True, False):
+            assert format_task(task, show_next_run) == format_task_list(
+                [task], show_next_run
+            )
+
+
+class TestSplitArguments:
+    """Tests for split_arguments."""
+
+    def test_matches_shlex_split(self):
+        samples = [
+            "",
+            "--verbose",
+            "  --mode fast\t--retries 3 ",
+            "#not-a-comment x",
+            '--name "my task"',
+            "--path 'C:\\dir' a\\ b",
+            "a\x0cb",
+            "caf\u00e9\u00a0bar",
+        ]
+        for text in samples:
+            assert split_arguments(text) == shlex.split(text), text
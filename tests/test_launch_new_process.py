@@ -204,7 +204,7 @@ class TestRunTaskLaunchNewProcess:
             "start_time": None,
             "launch_new_process": True,
         }
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.launch_in_new_console.return_value = True
 
         result = mock_scheduler.run_task(1)
@@ -228,7 +228,7 @@ class TestRunTaskLaunchNewProcess:
             "start_time": None,
             "launch_new_process": False,
         }
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.run_script.return_value = True
 
         result = mock_scheduler.run_task(1)
@@ -250,7 +250,7 @@ class TestRunTaskLaunchNewProcess:
             "start_time": None,
             "launch_new_process": True,
         }
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.launch_in_new_console.return_value = True
 
         mock_scheduler.run_task(42)
@@ -0,0 +1,116 @@
+"""Tests for command line parsing in main.py."""
+
+from unittest.mock import MagicMock, patch
+
+import main
+from src.cli_output import CliOutput
+from src.scheduler import TaskScheduler
+
+
+def _namespace(**overrides):
+    """Namespace with every option at its parser default, plus overrides."""
+    args = main.parse_arguments([])
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
+
+
+class TestParseArguments:
+    """Tests for parse_arguments."""
+
+    def test_no_arguments_gives_defaults(self):
+        args = main.parse_arguments([])
+
+        assert args.list is None
+        assert args.add is False
+        assert args.script_args == []
+
+    def test_list_with_filter(self):
+        assert main.parse_arguments(["--list", "backup"]).list == "backup"
+
+    def test_parse_arguments_reads_other_options(self):
+        args = main.parse_arguments(["--run_id", "3"])
+
+        assert args.run_id == 3
+        assert args.list is None
+
+    def test_script_args_split_at_double_dash(self):
+        args = main.parse_arguments(
+            ["--script", "s.py", "--interval", "5", "--", "--name", "x"]
+        )
+
+        assert args.name is None
+        assert args.interval == 5
+        assert args.script_args == ["--", "--name", "x"]
+
+    def test_no_double_dash_gives_empty_script_args(self):
+        args = main.parse_arguments(["--script", "s.py", "--interval", "5"])
+
+        assert args.script_args == []
+
+    def test_script_args_not_shared_between_calls(self):
+        first = main.parse_arguments([])
+        first.script_args.append("x")
+
+        assert main.parse_arguments([]).script_args == []
+
+
+class TestGetParser:
+    """Tests for the cached parser."""
+
+    def test_parser_is_built_once(self):
+        assert main._get_parser() is main._get_parser()
+
+
+class TestRunCommand:
+    """Tests for the one-shot command dispatch table."""
+
+    def test_no_command_returns_false(self):
+        assert main._run_command(_namespace(), MagicMock(spec=CliOutput)) is False
+
+    def test_list_dispatches_with_scheduler_and_filter(self):
+        cli = MagicMock(spec=CliOutput)
+        scheduler = MagicMock(spec=TaskScheduler)
+
+        with patch.object(main, "_create_scheduler", return_value=scheduler), patch(
+            "src.commands.query.handle_list"
+        ) as handle_list:
+            ran = main._run_command(_namespace(list="backup"), cli)
+
+        assert ran is True
+        handle_list.assert_called_once_with(scheduler, cli, "backup")
+
+    def test_set_interval_unpacks_pair(self):
+        cli = MagicMock(spec=CliOutput)
+        scheduler = MagicMock(spec=TaskScheduler)
+        args = _namespace(set_interval=["3", "4h"])
+
+        with patch.object(main, "_create_scheduler", return_value=scheduler), patch(
+            "src.commands.task_settings.handle_set_interval"
+        ) as handle_set_interval:
+            main._run_command(args, cli)
+
+        handle_set_interval.assert_called_once_with(scheduler, cli, "3", "4h")
+
+    def test_shutdown_does_not_create_scheduler(self):
+        cli = MagicMock(spec=CliOutput)
+
+        with patch.object(main, "_create_scheduler") as create_scheduler, patch(
+            "src.commands.lifecycle.handle_shutdown"
+        ) as handle_shutdown:
+            main._run_command(_namespace(shutdown=True), cli)
+
+        handle_shutdown.assert_called_once_with(cli)
+        create_scheduler.assert_not_called()
+
+    def test_first_requested_command_wins(self):
+        cli = MagicMock(spec=CliOutput)
+        args = _namespace(list="", history=10)
+
+        with patch.object(main, "_create_scheduler"), patch(
+            "src.commands.query.handle_list"
+        ) as handle_list, patch("src.commands.query.handle_history") as handle_history:
+            main._run_command(args, cli)
+
+        handle_list.assert_called_once()
+        handle_history.assert_not_called()
@@ -92,7 +92,7 @@ class TestRunTaskManualOnly:
             "command": None,
             "start_time": None,
         }
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.run_script.return_value = True
 
         result = mock_scheduler.run_task(1)
@@ -164,6 +164,57 @@ class TestListTasksManualOnly:
 
         assert tasks[0]["next_run_time"] is None
 
+    def test_get_task_manual_has_none_next_run_time(self, mock_scheduler):
+        """get_task should enrich a manual-only task the same way list_tasks does."""
+        task = {
+            "id": 1,
+            "name": "Manual Task",
+            "script_path": "/path/to/script.py",
+            "arguments": [],
+            "interval": 0,
+            "task_type": TaskTypes.SCRIPT,
+            "command": None,
+            "start_time": None,
+        }
+        mock_scheduler.db.get_task.return_value = task
+        mock_scheduler.scheduler.get_job.return_value = None
+        mock_scheduler.db.get_last_execution.return_value = None
+
+        result = mock_scheduler.get_task(1)
+
+        assert result["next_run_time"] is None
+        assert result["last_run_time"] is None
+        mock_scheduler.db.get_task.assert_called_once_with(1)
+
+
+class TestStartManualOnly:
+    """Tests for start() with manual-only tasks."""
+
+    def test_start_returns_tasks_with_run_info(self, mock_scheduler):
+        """start() should return the loaded tasks enriched like list_tasks."""
+        task = {
+            "id": 1,
+            "name": "Manual Task",
+            "script_path": "/path/to/script.py",
+            "arguments": [],
+            "interval": 0,
+            "task_type": TaskTypes.SCRIPT,
+            "command": None,
+            "start_time": None,
+        }
+        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_last_execution_per_task.return_value = {
+            1: {"execution_time": "2024-01-01 10:00:00", "success": True}
+        }
+        mock_scheduler.scheduler.get_jobs.return_value = []
+
+        tasks = mock_scheduler.start()
+
+        assert tasks[0]["next_run_time"] is None
+        assert tasks[0]["last_run_time"] == "2024-01-01 10:00:00"
+        assert tasks[0]["last_run_success"] is True
+        mock_scheduler.db.get_last_execution_per_task.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # CLI Formatter tests
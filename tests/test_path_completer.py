@@ -0,0 +1,81 @@
+"""Tests for src.path_completer.CachedPathCompleter."""
+
+import os
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from src.path_completer import CachedPathCompleter, ThresholdCompleter
+
+
+def _complete(completer, text):
+    return list(completer.get_completions(Document(text), CompleteEvent()))
+
+
+class TestCachedPathCompleter:
+    """Tests for CachedPathCompleter."""
+
+    def test_case_insensitive_prefix_match(self, tmp_path):
+        (tmp_path / "Backup.py").write_text("")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "other.py").write_text("")
+
+        completions = _complete(CachedPathCompleter(), str(tmp_path / "b"))
+
+        assert [c.text for c in completions] == ["Backup.py", "build"]
+        assert [c.display_text for c in completions] == ["Backup.py", "build/"]
+        assert all(c.start_position == -1 for c in completions)
+
+    def test_directory_listing_is_cached(self, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text("")
+        completer = CachedPathCompleter()
+        calls = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            calls.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        _complete(completer, str(tmp_path) + os.sep)
+        _complete(completer, str(tmp_path / "a"))
+
+        assert len(calls) == 1
+
+    def test_cache_refreshed_when_directory_changes(self, tmp_path):
+        (tmp_path / "a.py").write_text("")
+        completer = CachedPathCompleter()
+        _complete(completer, str(tmp_path / "a"))
+
+        (tmp_path / "ab.py").write_text("")
+        stat = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        completions = _complete(completer, str(tmp_path / "a"))
+        assert [c.text for c in completions] == ["a.py", "ab.py"]
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        assert _complete(CachedPathCompleter(), str(tmp_path / "missing" / "x")) == []
+
+
+class TestThresholdCompleter:
+    """Tests for ThresholdCompleter."""
+
+    def test_short_input_skipped_while_typing(self, tmp_path):
+        (tmp_path / "abc.py").write_text("")
+        completer = ThresholdCompleter(CachedPathCompleter())
+
+        assert _complete(completer, str(tmp_path / "ab")) == []
+        assert [c.text for c in _complete(completer, str(tmp_path / "abc"))] == [
+            "abc.py"
+        ]
+
+    def test_tab_always_completes(self, tmp_path):
+        (tmp_path / "abc.py").write_text("")
+        completer = ThresholdCompleter(CachedPathCompleter())
+
+        completions = completer.get_completions(
+            Document(str(tmp_path / "a")), CompleteEvent(completion_requested=True)
+        )
+        assert [c.text for c in completions] == ["abc.py"]
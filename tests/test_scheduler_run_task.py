@@ -51,7 +51,7 @@ class TestRunTaskReturnValue:
     def test_run_task_returns_true_on_success(self, mock_scheduler):
         """run_task should return True when script execution succeeds."""
         task = _make_task()
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.run_script.return_value = True
 
         result = mock_scheduler.run_task(1)
@@ -61,7 +61,7 @@ class TestRunTaskReturnValue:
     def test_run_task_returns_false_on_failure(self, mock_scheduler):
         """run_task should return False when script execution fails."""
         task = _make_task()
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.run_script.return_value = False
 
         result = mock_scheduler.run_task(1)
@@ -70,7 +70,7 @@ class TestRunTaskReturnValue:
 
     def test_run_task_raises_for_nonexistent_task(self, mock_scheduler):
         """run_task should raise ValueError when task_id does not exist."""
-        mock_scheduler.db.get_all_tasks.return_value = []
+        mock_scheduler.db.get_task.return_value = None
 
         with pytest.raises(ValueError, match="Task with ID 999 not found"):
             mock_scheduler.run_task(999)
@@ -82,7 +82,7 @@ class TestRunTaskReturnValue:
             command="my-cmd",
             script_path="/path/to/project",
         )
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.run_uv_command.return_value = True
 
         result = mock_scheduler.run_task(1)
@@ -96,7 +96,7 @@ class TestRunTaskReturnValue:
             command="my-cmd",
             script_path="/path/to/project",
         )
-        mock_scheduler.db.get_all_tasks.return_value = [task]
+        mock_scheduler.db.get_task.return_value = task
         mock_scheduler.script_runner.run_uv_command.return_value = False
 
         result = mock_scheduler.run_task(1)
@@ -173,3 +173,24 @@ class TestProcessJobReturnValue:
         )
 
         mock_scheduler.status_page.update.assert_called_once()
+
+
+class TestTaskVersion:
+    """Tests for the task set version used by cached views."""
+
+    def test_remove_task_bumps_version(self, mock_scheduler):
+        mock_scheduler.db.get_task.return_value = _make_task()
+        before = mock_scheduler.get_version()
+
+        mock_scheduler.remove_task(1)
+
+        assert mock_scheduler.get_version() != before
+
+    def test_run_task_keeps_version(self, mock_scheduler):
+        mock_scheduler.db.get_task.return_value = _make_task()
+        mock_scheduler.script_runner.run_script.return_value = True
+        before = mock_scheduler.get_version()
+
+        mock_scheduler.run_task(1)
+
+        assert mock_scheduler.get_version() == before
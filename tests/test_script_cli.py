@@ -0,0 +1,82 @@
+"""Tests for the --script CLI path."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.cli_output import CliOutput
+from src.commands.task_crud import handle_script
+from src.scheduler import TaskScheduler
+
+
+@pytest.fixture
+def mock_scheduler() -> MagicMock:
+    return MagicMock(spec=TaskScheduler)
+
+
+@pytest.fixture
+def mock_logger() -> MagicMock:
+    return MagicMock(spec=CliOutput)
+
+
+def _make_args(
+    interval: int | None = 5,
+    start_time: str | None = None,
+    launch_new_process: bool = False,
+) -> MagicMock:
+    args = MagicMock()
+    args.script = "C:\\scripts\\backup.py"
+    args.name = "Backup"
+    args.interval = interval
+    args.start_time = start_time
+    args.launch_new_process = launch_new_process
+    args.script_args = []
+    return args
+
+
+class TestHandleScriptManualOnly:
+    """Tests for adding manual-only (interval 0) script tasks."""
+
+    def test_interval_zero_adds_manual_task(
+        self, mock_scheduler: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        handle_script(mock_scheduler, mock_logger, _make_args(interval=0))
+
+        mock_scheduler.add_task.assert_called_once_with(
+            "Backup",
+            "C:\\scripts\\backup.py",
+            0,
+            [],
+            start_time=None,
+            launch_new_process=False,
+        )
+
+    def test_interval_zero_accepts_launch_new_process(
+        self, mock_scheduler: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        args = _make_args(interval=0, launch_new_process=True)
+
+        handle_script(mock_scheduler, mock_logger, args)
+
+        assert mock_scheduler.add_task.call_args.kwargs["launch_new_process"] is True
+        mock_logger.error.assert_not_called()
+
+    def test_launch_new_process_rejected_for_scheduled_task(
+        self, mock_scheduler: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        args = _make_args(interval=5, launch_new_process=True)
+
+        with pytest.raises(SystemExit):
+            handle_script(mock_scheduler, mock_logger, args)
+        mock_scheduler.add_task.assert_not_called()
+        assert "--launch-new-process" in mock_logger.error.call_args[0][0]
+
+    def test_start_time_rejected_for_interval_zero(
+        self, mock_scheduler: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        args = _make_args(interval=0, start_time="09:00")
+
+        with pytest.raises(SystemExit):
+            handle_script(mock_scheduler, mock_logger, args)
+        mock_scheduler.add_task.assert_not_called()
+        assert "manual-only" in mock_logger.error.call_args[0][0]
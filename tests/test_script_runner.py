@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+import tomllib
 from unittest.mock import patch
 import pytest
 from src.script_runner import ScriptRunner
@@ -135,6 +136,27 @@ cmd2 = "test.cli:run"
         assert "cmd1" in result
         assert "cmd2" in result
 
+    def test_get_uv_commands_reuses_parse_until_file_changes(self, runner, temp_dir):
+        pyproject_path = os.path.join(temp_dir, Paths.PYPROJECT_TOML)
+        with open(pyproject_path, "w") as f:
+            f.write("[project.scripts]\ncmd1 = 'test.main:main'\n")
+
+        with patch("src.script_runner.tomllib.load", wraps=tomllib.load) as load:
+            assert runner.get_uv_commands(temp_dir) == ["cmd1"]
+            assert runner.get_uv_commands(temp_dir) == ["cmd1"]
+            assert load.call_count == 1
+
+            with open(pyproject_path, "w") as f:
+                f.write("[project.scripts]\ncmd2 = 'test.cli:run'\n")
+            stat_result = os.stat(pyproject_path)
+            os.utime(
+                pyproject_path,
+                ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000),
+            )
+
+            assert runner.get_uv_commands(temp_dir) == ["cmd2"]
+            assert load.call_count == 2
+
 
 class TestRunUvCommand:
     """Tests for run_uv_command method."""
@@ -3,10 +3,12 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from prompt_toolkit import PromptSession
+
 from src.cli_output import CliOutput
 from src.constants import TaskTypes
 from src.scheduler import TaskScheduler
-from src.commands.task_settings import handle_rename
+from src.commands.task_settings import handle_rename, handle_set_arguments
 
 
 @pytest.fixture
@@ -23,7 +25,7 @@ def mock_cli():
 
 @pytest.fixture
 def sample_task():
-    """A sample task dict as returned by list_tasks()."""
+    """A sample task dict as returned by get_task()."""
     return {
         "id": 5,
         "name": "Old Name",
@@ -41,7 +43,7 @@ class TestHandleRename:
 
     def test_rename_succeeds(self, mock_scheduler, mock_cli, sample_task):
         """Rename calls edit_task with the new name and all other fields unchanged."""
-        mock_scheduler.list_tasks.return_value = [sample_task]
+        mock_scheduler.get_task.return_value = sample_task
 
         handle_rename(mock_scheduler, mock_cli, 5, "New Name")
 
@@ -62,7 +64,7 @@ class TestHandleRename:
 
     def test_task_not_found_exits(self, mock_scheduler, mock_cli):
         """Exits with error when task ID does not exist."""
-        mock_scheduler.list_tasks.return_value = []
+        mock_scheduler.get_task.return_value = None
 
         with pytest.raises(SystemExit) as exc_info:
             handle_rename(mock_scheduler, mock_cli, 99, "New Name")
@@ -72,7 +74,7 @@ class TestHandleRename:
 
     def test_edit_task_error_exits(self, mock_scheduler, mock_cli, sample_task):
         """Exits with error when edit_task raises ValueError."""
-        mock_scheduler.list_tasks.return_value = [sample_task]
+        mock_scheduler.get_task.return_value = sample_task
         mock_scheduler.edit_task.side_effect = ValueError("Name already exists")
 
         with pytest.raises(SystemExit) as exc_info:
@@ -85,13 +87,15 @@ class TestHandleRename:
         self, mock_scheduler, mock_cli, sample_task
     ):
         """Prompts interactively when new_name is None."""
-        mock_scheduler.list_tasks.return_value = [sample_task]
+        mock_scheduler.get_task.return_value = sample_task
 
-        with patch("src.commands.task_settings.PromptSession") as mock_session_cls:
-            mock_session = MagicMock()
-            mock_session_cls.return_value = mock_session
-            mock_session.prompt.return_value = "Prompted Name"
+        mock_session = MagicMock(spec=PromptSession)
+        mock_session.prompt.return_value = "Prompted Name"
 
+        with patch(
+            "src.commands.task_settings._get_prompt_session",
+            return_value=mock_session,
+        ):
             handle_rename(mock_scheduler, mock_cli, 5)
 
         mock_scheduler.edit_task.assert_called_once_with(
@@ -111,13 +115,15 @@ class TestHandleRename:
         self, mock_scheduler, mock_cli, sample_task
     ):
         """Empty prompt input keeps the current name."""
-        mock_scheduler.list_tasks.return_value = [sample_task]
+        mock_scheduler.get_task.return_value = sample_task
 
-        with patch("src.commands.task_settings.PromptSession") as mock_session_cls:
-            mock_session = MagicMock()
-            mock_session_cls.return_value = mock_session
-            mock_session.prompt.return_value = ""
+        mock_session = MagicMock(spec=PromptSession)
+        mock_session.prompt.return_value = ""
 
+        with patch(
+            "src.commands.task_settings._get_prompt_session",
+            return_value=mock_session,
+        ):
             handle_rename(mock_scheduler, mock_cli, 5)
 
         mock_scheduler.edit_task.assert_called_once_with(
@@ -131,3 +137,82 @@ class TestHandleRename:
             start_time="09:00",
             launch_new_process=False,
         )
+
+
+class TestHandleSetArguments:
+    """Tests for handle_set_arguments."""
+
+    def _run(self, mock_scheduler, mock_cli, sample_task, text):
+        mock_scheduler.get_task.return_value = sample_task
+
+        mock_session = MagicMock(spec=PromptSession)
+        mock_session.prompt.return_value = text
+
+        with patch("sys.stdin") as mock_stdin, patch(
+            "src.cli_input._get_prompt_session",
+            return_value=mock_session,
+        ):
+            mock_stdin.isatty.return_value = True
+
+            handle_set_arguments(mock_scheduler, mock_cli, 5)
+
+        mock_session.prompt.assert_called_once()
+        return mock_scheduler.edit_task.call_args.kwargs["arguments"]
+
+    def test_lines_joined_and_split(self, mock_scheduler, mock_cli, sample_task):
+        """All lines from the single multi-line prompt form the arguments."""
+        arguments = self._run(
+            mock_scheduler,
+            mock_cli,
+            sample_task,
+            '--source "a b"\n\n  --target c  \n',
+        )
+
+        assert arguments == ["--source", "a b", "--target", "c"]
+
+    def test_empty_input_keeps_current(self, mock_scheduler, mock_cli, sample_task):
+        """Submitting nothing keeps the current arguments."""
+        arguments = self._run(mock_scheduler, mock_cli, sample_task, "")
+
+        assert arguments == ["--verbose"]
+
+    def test_none_clears_arguments(self, mock_scheduler, mock_cli, sample_task):
+        """Typing 'none' clears the arguments."""
+        arguments = self._run(mock_scheduler, mock_cli, sample_task, "None\n")
+
+        assert arguments is None
+
+    def _run_piped(self, mock_scheduler, mock_cli, sample_task, lines):
+        mock_scheduler.get_task.return_value = sample_task
+
+        with patch("sys.stdin") as mock_stdin, patch(
+            "src.cli_input._get_prompt_session"
+        ) as mock_get_session:
+            mock_stdin.isatty.return_value = False
+            mock_stdin.readline.side_effect = [*lines, ""]
+
+            handle_set_arguments(mock_scheduler, mock_cli, 5)
+
+        mock_get_session.assert_not_called()
+        return mock_scheduler.edit_task.call_args.kwargs["arguments"]
+
+    def test_piped_input_skips_prompt(self, mock_scheduler, mock_cli, sample_task):
+        """Piped stdin is read directly without creating a PromptSession."""
+        arguments = self._run_piped(
+            mock_scheduler, mock_cli, sample_task, ["--source a\n", "--target b\n"]
+        )
+
+        assert arguments == ["--source", "a", "--target", "b"]
+
+    def test_piped_input_stops_at_blank_line(
+        self, mock_scheduler, mock_cli, sample_task
+    ):
+        """Lines after the first blank line are not read as arguments."""
+        arguments = self._run_piped(
+            mock_scheduler,
+            mock_cli,
+            sample_task,
+            ["--source a\n", "\n", "--target b\n"],
+        )
+
+        assert arguments == ["--source", "a"]
@@ -96,6 +96,20 @@ class TestHandleUvCommandValidation:
         mock_logger.error.assert_called_once()
         assert "Invalid start time" in mock_logger.error.call_args[0][0]
 
+    def test_invalid_start_time_rejected_before_directory_check(
+        self, mock_scheduler: MagicMock, mock_logger: MagicMock
+    ) -> None:
+        args = _make_args(
+            uv_command=["/nonexistent/project", "my-cmd"],
+            name="Test Task",
+            interval=5,
+            start_time="25:99",
+        )
+        with pytest.raises(SystemExit):
+            handle_uv_command(mock_scheduler, mock_logger, args)
+        mock_logger.error.assert_called_once()
+        assert "Invalid start time" in mock_logger.error.call_args[0][0]
+
 
 class TestHandleUvCommandProjectValidation:
     """Tests for uv project directory validation."""